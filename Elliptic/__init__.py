@@ -1,2 +1,5 @@
 from .elliptic import *
 from .simplicityTests import *
+from .encoding import *
+from .curves import *
+from .field import *
@@ -0,0 +1,32 @@
+"""
+    Module contains parameters of standard elliptic curves
+    of the following form: y^2 = x^3 + a*x + b\n
+
+"""
+
+from collections import namedtuple
+from .elliptic import create_point
+
+
+Curve = namedtuple("Curve", "a_value b_value field point order")
+
+
+SECP256K1 = Curve(
+    a_value=0,
+    b_value=7,
+    field=2 ** 256 - 2 ** 32 - 977,
+    point=create_point(
+        0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+        0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8),
+    order=0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+)
+
+P256 = Curve(
+    a_value=2 ** 256 - 2 ** 224 + 2 ** 192 + 2 ** 96 - 4,
+    b_value=0x5AC635D8AA3A93E7B3EBBD55769886BC651D06B0CC53B0F63BCE3C3E27D2604B,
+    field=2 ** 256 - 2 ** 224 + 2 ** 192 + 2 ** 96 - 1,
+    point=create_point(
+        0x6B17D1F2E12C4247F8BCE6E563A440F277037D812DEB33A0F4A13945D898C296,
+        0x4FE342E2FE1A7F9B8EE7EB4A7C0F9E162BCE33576B315ECECBB6406837BF51F5),
+    order=0xFFFFFFFF00000000FFFFFFFFFFFFFFFFBCE6FAADA7179E84F3B9CAC2FC632551
+)
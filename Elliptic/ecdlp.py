@@ -0,0 +1,454 @@
+"""
+    Module contains elliptic curve discrete logarithm solvers: for given
+    points P and Q = k*P it finds k\n
+    -> baby-step giant-step for tiny groups\n
+    -> Pollard rho with r-adding walks, batched inversions and
+    distinguished points, serial or across processes\n
+    -> Pohlig-Hellman reduction over the group order factorization\n
+    Every solver returns a DLogResult with the number of iterations
+    (group operations of the walk or table) and iterations per second\n
+
+"""
+
+from collections import namedtuple
+from math import isqrt
+from multiprocessing import (
+    Event,
+    Process,
+    Queue
+)
+from queue import Empty
+from random import Random
+from time import perf_counter
+from sympy import factorint
+from sympy.ntheory.modular import crt
+from .field import (
+    batch_inverse,
+    prime_field
+)
+from .projective import double_and_add
+
+
+DLogResult = namedtuple("DLogResult", "log iterations seconds rate")
+
+# Prime subgroups up to this order are solved with baby-step giant-step
+BSGS_LIMIT = 2 ** 24
+# Number of precomputed steps of r-adding walk
+WALK_STEPS = 20
+# Number of walks stepped together with one batched inversion
+WALK_BATCH = 64
+# Rounds of walk batch between reports of distinguished points
+REPORT_ROUNDS = 32
+# Seconds to wait for a report before walk processes are checked
+REPORT_TIMEOUT = 1.0
+# Pollard rho iterations limit in Pohlig-Hellman in sqrt(q) units, a
+# subgroup member is found in about 1.25 * sqrt(q) iterations
+RHO_BOUND = 10
+
+
+def create_result(log, iterations, seconds):
+
+    """
+    Function creates a DLogResult with iterations per second rate\n
+
+    :param int log: found discrete logarithm\n
+    :param int iterations: number of performed iterations\n
+    :param float seconds: spent time\n
+
+    """
+
+    rate = iterations / seconds if seconds > 0 else float(iterations)
+    return DLogResult(log, iterations, seconds, rate)
+
+
+def add_affine(f_point, s_point, field, a_value):
+
+    """
+    Function finds a sum of two affine points\n
+    Points are (x, y) tuples or None for point at infinity\n
+
+    :param tuple f_point: first point\n
+    :param tuple s_point: second point\n
+    :param int field: an a curve field\n
+    :param int a_value: an a value in elliptic form E(a, b)\n
+
+    """
+
+    if f_point is None:
+        return s_point
+    if s_point is None:
+        return f_point
+    if f_point[0] == s_point[0]:
+        if (f_point[1] + s_point[1]) % field == 0:
+            return None
+        alpha = ((3 * f_point[0] * f_point[0] + a_value) *
+                 pow(2 * f_point[1], -1, field))
+    else:
+        alpha = ((s_point[1] - f_point[1]) *
+                 pow(s_point[0] - f_point[0], -1, field))
+    rx_value = (alpha * alpha - f_point[0] - s_point[0]) % field
+    return (rx_value, (alpha * (f_point[0] - rx_value) - f_point[1]) % field)
+
+
+def combine_points(point, target, c_value, d_value, field, a_value):
+
+    """
+    Function finds c*P + d*Q for affine points P and Q\n
+
+    :param tuple point: P point\n
+    :param tuple target: Q point\n
+    :param int c_value: P coefficient\n
+    :param int d_value: Q coefficient\n
+    :param int field: an a curve field\n
+    :param int a_value: an a value in elliptic form E(a, b)\n
+
+    """
+
+    return add_affine(double_and_add(point, c_value, field, a_value),
+                      double_and_add(target, d_value, field, a_value),
+                      field, a_value)
+
+
+def affine(point):
+
+    """
+    Function converts a Point namedtuple or None into an (x, y) tuple\n
+
+    :param tuple point: point or None for point at infinity\n
+
+    """
+
+    return None if point is None else (point[0], point[1])
+
+
+def bsgs(point, target, order, field, a_value):
+
+    """
+    Function finds discrete logarithm of target to the base point with
+    baby-step giant-step algorithm in O(sqrt(order)) time and memory\n
+    Possible values: DLogResult,
+                     ValueError (In case target isn't a multiple of point)\n
+
+    :param tuple point: base point of the given order\n
+    :param tuple target: point which logarithm is required\n
+    :param int order: order of the base point\n
+    :param int field: an a curve field\n
+    :param int a_value: an a value in elliptic form E(a, b)\n
+
+    """
+
+    start = perf_counter()
+    point, target = affine(point), affine(target)
+    field = prime_field(field)
+    steps = isqrt(order - 1) + 1
+
+    # Baby steps j*P, j = 0 .. steps - 1
+    table = dict()
+    baby = None
+    for index in range(steps):
+        table.setdefault(baby, index)
+        baby = add_affine(baby, point, field, a_value)
+
+    # Giant steps Q - i*steps*P
+    giant = double_and_add(point, steps, field, a_value)
+    giant = None if giant is None else (giant[0], -giant[1] % field)
+    current = target
+    for index in range(steps):
+        if current in table:
+            log = (index * steps + table[current]) % order
+            return create_result(log, steps + index + 1,
+                                 perf_counter() - start)
+        current = add_affine(current, giant, field, a_value)
+
+    raise ValueError("Target point doesn't belong to point subgroup")
+
+
+def create_walk_table(point, target, order, field, a_value, rng):
+
+    """
+    Function creates steps R_j = c_j*P + d_j*Q of an r-adding walk\n
+    Returns a list of (x, y, c_j, d_j) tuples\n
+
+    :param tuple point: P point\n
+    :param tuple target: Q point\n
+    :param int order: prime order of P\n
+    :param int field: an a curve field\n
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param Random rng: random generator\n
+
+    """
+
+    table = list()
+    while len(table) < WALK_STEPS:
+        c_value, d_value = rng.randrange(order), rng.randrange(order)
+        step = combine_points(point, target, c_value, d_value, field, a_value)
+        if step is not None:
+            table.append(step + (c_value, d_value))
+    return table
+
+
+def run_walks(arguments, seed, report):
+
+    """
+    Function runs WALK_BATCH r-adding walks stepped together: each round
+    needs one batched inversion for all walks. A walk that reaches a
+    distinguished point (x with dp_bits low zero bits) stores it and
+    restarts from a random c*P + d*Q\n
+    Every REPORT_ROUNDS rounds report(points, steps) is called with found
+    distinguished points as (x, y, c, d) tuples; walks stop when it
+    returns True\n
+
+    :param tuple arguments: (point, target, order, field, a_value,
+    walk table, dp_bits)\n
+    :param int seed: random generator seed\n
+    :param callable report: collector of distinguished points\n
+
+    """
+
+    point, target, order, field, a_value, table, dp_bits = arguments
+    rng = Random(seed)
+    mask = (1 << dp_bits) - 1
+    # Walks longer than this are considered stuck in a cycle
+    max_length = 20 << dp_bits
+
+    def restart():
+        while True:
+            c_value, d_value = rng.randrange(order), rng.randrange(order)
+            start = combine_points(point, target, c_value, d_value,
+                                   field, a_value)
+            if start is not None:
+                return list(start) + [c_value, d_value, 0]
+
+    walks = [restart() for _ in range(WALK_BATCH)]
+    while True:
+        found = list()
+        for _ in range(REPORT_ROUNDS):
+            steps = [table[walk[0] % WALK_STEPS] for walk in walks]
+            differences = [(step[0] - walk[0]) % field or 1
+                           for step, walk in zip(steps, walks)]
+            inverses = batch_inverse(differences, field)
+            for index, walk in enumerate(walks):
+                x_value, y_value, c_value, d_value, length = walk
+                step = steps[index]
+                if step[0] == x_value:
+                    # Doubling or point at infinity, start a new walk
+                    walks[index] = restart()
+                    continue
+                alpha = (step[1] - y_value) * inverses[index] % field
+                rx_value = (alpha * alpha - x_value - step[0]) % field
+                ry_value = (alpha * (x_value - rx_value) - y_value) % field
+                c_value = (c_value + step[2]) % order
+                d_value = (d_value + step[3]) % order
+                if rx_value & mask == 0:
+                    found.append((rx_value, ry_value, c_value, d_value))
+                    walks[index] = restart()
+                elif length >= max_length:
+                    walks[index] = restart()
+                else:
+                    walks[index] = [rx_value, ry_value, c_value, d_value,
+                                    length + 1]
+        if report(found, REPORT_ROUNDS * WALK_BATCH):
+            return
+
+
+def walk_process(arguments, seed, queue, stop):
+
+    """
+    Function runs walks in a separate process and sends distinguished
+    points to the queue until stop event is set\n
+
+    :param tuple arguments: run_walks arguments\n
+    :param int seed: random generator seed\n
+    :param Queue queue: queue of (points, steps) reports\n
+    :param Event stop: stop event\n
+
+    """
+
+    def report(found, steps):
+        queue.put((found, steps))
+        return stop.is_set()
+
+    run_walks(arguments, seed, report)
+
+
+def solve_collision(stored, found, order):
+
+    """
+    Function finds a logarithm from two distinguished points with equal x:
+    c1*P + d1*Q = +-(c2*P + d2*Q)\n
+    Possible values: int, None (In case collision is useless)\n
+
+    :param tuple stored: (y, c, d) of the first point\n
+    :param tuple found: (y, c, d) of the second point\n
+    :param int order: prime order of P\n
+
+    """
+
+    y_first, c_first, d_first = stored
+    y_second, c_second, d_second = found
+    if y_first == y_second:
+        numerator, denominator = c_first - c_second, d_second - d_first
+    else:
+        numerator, denominator = c_first + c_second, -(d_first + d_second)
+    if denominator % order == 0:
+        return None
+    return numerator * pow(denominator, order - 2, order) % order
+
+
+def pollard_rho(point, target, order, field, a_value, processes=1,
+                dp_bits=None, max_iterations=None, seed=None):
+
+    """
+    Function finds discrete logarithm of target to the base point of prime
+    order with Pollard rho method (r-adding walks and distinguished
+    points). With processes > 1 walks run in parallel processes sharing
+    one walk table, so a collision between any two processes is found\n
+    Possible values: DLogResult,
+                     ValueError (In case max_iterations is exceeded),
+                     RuntimeError (In case a walk process has stopped)\n
+
+    :param tuple point: base point of the given order\n
+    :param tuple target: point which logarithm is required\n
+    :param int order: prime order of the base point\n
+    :param int field: an a curve field\n
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int processes: number of walk processes (optional)\n
+    :param int dp_bits: zero low bits of a distinguished point (optional)\n
+    :param int max_iterations: iterations limit (optional)\n
+    :param int seed: random generator seed (optional)\n
+
+    """
+
+    start = perf_counter()
+    point, target = affine(point), affine(target)
+    field = prime_field(field)
+    if target is None:
+        return create_result(0, 0, perf_counter() - start)
+    if dp_bits is None:
+        dp_bits = max(0, order.bit_length() // 4 - 2)
+
+    rng = Random(seed)
+    arguments = (point, target, order, field, a_value,
+                 create_walk_table(point, target, order, field, a_value, rng),
+                 dp_bits)
+    distinguished = dict()
+    state = {"iterations": 0, "log": None}
+
+    def report(found, steps):
+        state["iterations"] += steps
+        for x_value, y_value, c_value, d_value in found:
+            if x_value not in distinguished:
+                distinguished[x_value] = (y_value, c_value, d_value)
+                continue
+            log = solve_collision(distinguished[x_value],
+                                  (y_value, c_value, d_value), order)
+            if (log is not None and
+                    double_and_add(point, log, field, a_value) == target):
+                state["log"] = log
+                return True
+        if (max_iterations is not None and
+                state["iterations"] >= max_iterations):
+            raise ValueError("Iterations limit is exceeded")
+        return False
+
+    if processes <= 1:
+        run_walks(arguments, rng.getrandbits(64), report)
+    else:
+        queue, stop = Queue(), Event()
+        workers = [Process(target=walk_process,
+                           args=(arguments, rng.getrandbits(64), queue, stop),
+                           daemon=True)
+                   for _ in range(processes)]
+        for worker in workers:
+            worker.start()
+        try:
+            while True:
+                try:
+                    found, steps = queue.get(timeout=REPORT_TIMEOUT)
+                except Empty:
+                    if not all(worker.is_alive() for worker in workers):
+                        raise RuntimeError("Walk process has stopped")
+                    continue
+                if report(found, steps):
+                    break
+        finally:
+            stop.set()
+            for worker in workers:
+                worker.terminate()
+                worker.join()
+
+    return create_result(state["log"], state["iterations"],
+                         perf_counter() - start)
+
+
+def pohlig_hellman(point, target, order, field, a_value, processes=1,
+                   factors=None):
+
+    """
+    Function finds discrete logarithm of target to the base point with
+    Pohlig-Hellman reduction: logarithm is found modulo every prime power
+    q^e of the order, digit by digit in subgroups of prime order q
+    (baby-step giant-step up to BSGS_LIMIT, Pollard rho limited to
+    RHO_BOUND * sqrt(q) iterations above), and combined with chinese
+    remainder theorem\n
+    Possible values: DLogResult,
+                     ValueError (In case target isn't a multiple of point)\n
+
+    :param tuple point: base point of the given order\n
+    :param tuple target: point which logarithm is required\n
+    :param int order: order of the base point\n
+    :param int field: an a curve field\n
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int processes: number of Pollard rho processes (optional)\n
+    :param dict factors: order factorization {q: e} (optional)\n
+
+    """
+
+    start = perf_counter()
+    point, target = affine(point), affine(target)
+    field = prime_field(field)
+    if factors is None:
+        factors = factorint(order)
+    if target is not None and \
+            double_and_add(target, order, field, a_value) is not None:
+        raise ValueError("Target point doesn't belong to point subgroup")
+
+    iterations = 0
+    residues, moduli = list(), list()
+    for prime, exponent in factors.items():
+        # Generator of the subgroup of order prime
+        base = double_and_add(point, order // prime, field, a_value)
+        log = 0
+        for digit in range(exponent):
+            shifted = double_and_add(point, log, field, a_value)
+            shifted = None if shifted is None else \
+                (shifted[0], -shifted[1] % field)
+            difference = add_affine(target, shifted, field, a_value)
+            if difference is None:
+                break
+            # Point of order prime that holds the next digit
+            remainder = double_and_add(difference,
+                                       order // prime ** (digit + 1),
+                                       field, a_value)
+            if remainder is None:
+                continue
+            if prime <= BSGS_LIMIT:
+                result = bsgs(base, remainder, prime, field, a_value)
+            else:
+                # Walk doesn't end if remainder isn't a multiple of base
+                try:
+                    result = pollard_rho(
+                        base, remainder, prime, field, a_value, processes,
+                        max_iterations=RHO_BOUND * isqrt(prime))
+                except ValueError:
+                    raise ValueError(
+                        "Target point doesn't belong to point subgroup")
+            iterations += result.iterations
+            log += result.log * prime ** digit
+        residues.append(log)
+        moduli.append(prime ** exponent)
+
+    log = int(crt(moduli, residues)[0]) % order
+    if double_and_add(point, log, field, a_value) != target:
+        raise ValueError("Target point doesn't belong to point subgroup")
+    return create_result(log, iterations, perf_counter() - start)
@@ -0,0 +1,71 @@
+"""
+    Module contains unit tests for ecdlp module
+
+"""
+
+import unittest
+from Elliptic import ecdlp
+from Elliptic.elliptic import list_points
+from Elliptic.projective import double_and_add
+
+
+def stop_walk(*args):
+    raise SystemExit(1)
+
+
+def point_order(point, group_order, field, a_value):
+    return min(divisor for divisor in range(1, group_order + 1)
+               if group_order % divisor == 0 and
+               double_and_add(point, divisor, field, a_value) is None)
+
+
+class ecdlp_test(unittest.TestCase):
+
+    def test_bsgs(self):
+        for point in list_points(0, 5, 103):
+            for log in (0, 1, 45, 96):
+                target = double_and_add(point, log, 103, 0)
+                self.assertEqual(ecdlp.bsgs(point, target, 97, 103, 0).log,
+                                 log)
+
+    def test_pollard_rho(self):
+        # Order of points on y^2 = x^3 + 2*x + 40 over 1000003 is prime
+        point, order, field = (2, 536917), 999023, 1000003
+        for processes in (1, 2):
+            target = double_and_add(point, 123456 + processes, field, 2)
+            result = ecdlp.pollard_rho(point, target, order, field, 2,
+                                       processes, seed=processes)
+            self.assertEqual(result.log, 123456 + processes)
+            self.assertGreater(result.rate, 0)
+
+    def test_stopped_walk(self):
+        point, order, field = (2, 536917), 999023, 1000003
+        walk_process, ecdlp.walk_process = ecdlp.walk_process, stop_walk
+        try:
+            self.assertRaises(RuntimeError, ecdlp.pollard_rho, point, point,
+                              order, field, 2, 2)
+        finally:
+            ecdlp.walk_process = walk_process
+
+    def test_pohlig_hellman(self):
+        points = list_points(3, 5, 103)
+        for point in points[:10]:
+            order = point_order(point, 96, 103, 3)
+            for log in (0, 1, order // 2, order - 1):
+                target = double_and_add(point, log, 103, 3)
+                self.assertEqual(
+                    ecdlp.pohlig_hellman(point, target, order, 103, 3).log,
+                    log)
+        self.assertRaises(ValueError, ecdlp.pohlig_hellman,
+                          points[0], points[1], 2, 103, 3)
+        # Points (53, 0) and (64, 0) of order 2 generate distinct subgroups
+        bsgs_limit, ecdlp.BSGS_LIMIT = ecdlp.BSGS_LIMIT, 1
+        try:
+            self.assertRaises(ValueError, ecdlp.pohlig_hellman,
+                              (53, 0), (64, 0), 2, 103, 3)
+        finally:
+            ecdlp.BSGS_LIMIT = bsgs_limit
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,12 +10,33 @@ from collections import (
     defaultdict,
     namedtuple
 )
-from sympy import mod_inverse
 from math import sqrt
 from random import (
     randint,
     seed
 )
+from .field import prime_field
+from .glv import (
+    find_glv_parameters,
+    glv_multiply,
+    glv_window_multiply
+)
+from .models import (
+    has_fast_model,
+    has_order_two_point,
+    model_multiply
+)
+from .projective import (
+    double_and_add,
+    fixed_length_multiplier,
+    ladder_length,
+    ladder_multiply,
+    ladder_subtract,
+    to_affine,
+    to_projective,
+    window_multiply,
+    window_subtract
+)
 from .simplicityTests import (
     ferma_test,
     find_point_representation,
@@ -23,6 +44,9 @@ from .simplicityTests import (
 )
 
 
+Point = namedtuple("Point", "x_crd y_crd")
+
+
 def find_discriminant(a_value, b_value, field):
 
     """
@@ -52,7 +76,6 @@ def create_point(x_crd, y_crd):
 
     """
 
-    Point = namedtuple("Point", "x_crd y_crd")
     return Point(x_crd, y_crd)
 
 
@@ -165,15 +188,31 @@ def find_points(a_value, b_value, field):
     return points_dict
 
 
+def list_points(a_value, b_value, field):
+
+    """
+    Function lists affine points of elliptic curve found with
+    find_points, point at infinity is not included\n
+    Returns an a list of points of the following form:\n
+    [(x0, y01), (x0, y02), ..., (x(field - 1), y(field - 1)2)]\n
+
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int b_value: an b value in elliptic form E(a, b)\n
+    :param int field: an a curve field\n
+
+    """
+
+    return [create_point(x_value, y_value) for x_value, ordinates in
+            find_points(a_value, b_value, field).items()
+            for y_value in ordinates]
+
+
 def inverse_modulo(value, field):
     """
     Compute an inverse for x modulo p, assuming that x
     is not divisible by p.
     """
-    print("i_m", value)
-    if value % field == 0:
-        raise ZeroDivisionError("Impossible inverse")
-    return int(pow(value, field - 2, field))
+    return prime_field(field).inverse(value)
 
 
 def possible_devide(devinder, devider, field):
@@ -216,14 +255,19 @@ def add_points(f_point, s_point, field, a_value, b_value):
     # Initialize coordinates of the result point
     rx_value = int()
     ry_value = int()
+    field = prime_field(field)
 
-    # Find a sum of a given points
+    # Find a slope of the line through given points
     if f_point == s_point:
-        alpha = (3 * f_point.x_crd ** 2 + a_value) *
-        mod_inverse(2 * f_point.y_crd, field)
+        numerator = 3 * f_point.x_crd ** 2 + a_value
+        denominator = 2 * f_point.y_crd
     else:
-        alpha = (s_point.y_crd - f_point.y_crd) *
-        mod_inverse(s_point.x_crd - f_point.x_crd, field)
+        numerator = s_point.y_crd - f_point.y_crd
+        denominator = s_point.x_crd - f_point.x_crd
+    if denominator % field == 0:
+        raise ValueError("Denominator can not be equal zero")
+    alpha = numerator * pow(denominator, -1, field) % field
+
     # Find a sum of a given points
     rx_value = (alpha ** 2 - f_point.x_crd - s_point.x_crd) % field
     ry_value = (alpha * (f_point.x_crd - rx_value) - f_point.y_crd) % field
@@ -231,36 +275,116 @@ def add_points(f_point, s_point, field, a_value, b_value):
     return create_point(rx_value, ry_value)
 
 
-def multiply_point(point, multiplier, field, a_value, b_value):
+def multiply_point(point, multiplier, field, a_value, b_value,
+                   constant_time=False, order=None):
 
     """
     Function finds a composition of a given point on given multiplier\n
     Point is set in the tuple structure of the following form:\n
     (x_coord, y_coord)\n
     Returns an a tuple of the same structure\n
+    By default the fastest variable-time model is used: GLV endomorphism
+    on a = 0 curves of prime order, Montgomery ladder on curves that have
+    Montgomery form (point of order 2), Jacobian double-and-add otherwise.
+    With constant_time complete formulas run a fixed number of
+    iterations (bit length of order or of the Hasse bound), so running
+    time doesn't depend on the multiplier: fixed 4-bit windows with
+    masked table lookups for points of odd order (over GLV halves of the
+    multiplier where GLV applies, over the Hasse bound length if order
+    isn't given and the curve has no point of order 2), Montgomery
+    ladder otherwise\n
     Possible values: tuple([rx_value, ry_value]),
-                     -1, "Got an a point at infinity"\n
+                     ValueError, "Got a point an eternity...",
+                     ValueError (In case point doesn't belong to curve)\n
 
     :param tuple point: tuple that contains coordinates of the given point\n
     :param int multiplier: int coefficient\n
     :param int field: an a curve field\n
     :param int a_value: an a value in elliptic form E(a, b)\n
-    (optinal, it is required in case summ of the same point)
+    :param int b_value: an b value in elliptic form E(a, b)\n
+    :param bool constant_time: use side-channel resistant ladder (optional)\n
+    :param int order: order of the point, bounds the ladder and enables
+    GLV (optional)\n
 
     """
 
-    s_point = add_points(point, point, field, a_value, b_value)
-    multiplier -= 2
+    if not is_point_exist(point, a_value, b_value, field):
+        raise ValueError("Given point don't belong to elliptic curve")
 
-    # Find out how much 2P we must add further
-    while multiplier != 0:
-        multiplier -= 1
-        try:
-            s_point = add_points(s_point, point, field, a_value, b_value)    
-        except ValueError:
-            raise ValueError("Got a point an eternity...")
+    if multiplier < 0:
+        point = create_point(point.x_crd, -point.y_crd % field)
+        multiplier = -multiplier
+
+    if constant_time:
+        parameters = None
+        if order is not None:
+            parameters = find_glv_parameters(point, field, a_value, b_value,
+                                             order)
+        elif multiplier.bit_length() > ladder_length(field):
+            raise ValueError("Multiplier is longer than the ladder")
+        if point.y_crd == 0:
+            # Point of order 2 is the only exception of the ladder formulas,
+            # the branch depends on the public point only
+            r_point = tuple(point) if multiplier & 1 else None
+        elif parameters is not None:
+            # Decomposition reduces the multiplier modulo order itself
+            r_point = to_affine(
+                glv_window_multiply(point, multiplier, field, a_value,
+                                    b_value, order, parameters), field)
+        elif order is not None and order & 1:
+            # No point of order 2 in odd order subgroup, so complete
+            # formulas have no exceptions for any pair of summands.
+            # Regular digits need an odd multiplier, order is added to
+            # even ones with a mask
+            multiplier %= order
+            multiplier += order & ((multiplier & 1) - 1)
+            r_point = to_affine(
+                window_multiply(to_projective(point), multiplier,
+                                order.bit_length() + 1, field, a_value,
+                                b_value), field)
+        elif order is not None:
+            # Fixed bit length hides leading zeros of the multiplier
+            multiplier = fixed_length_multiplier(multiplier % order, order)
+            r_point = to_affine(
+                ladder_multiply(to_projective(point), multiplier,
+                                order.bit_length() + 1, field, a_value,
+                                b_value), field)
+        elif field > 3 and not has_order_two_point(a_value % field,
+                                                   b_value % field, field):
+            # Without point of order 2 every point has odd order, so
+            # fixed windows run over the Hasse bound length
+            r_point = to_affine(
+                window_subtract(to_projective(point), multiplier,
+                                ladder_length(field), field, a_value,
+                                b_value), field)
+        else:
+            # Without order the leading bit is set by adding 2^bits and
+            # 2^bits * P is subtracted afterwards
+            bits = ladder_length(field)
+            r_point = to_affine(
+                ladder_subtract(to_projective(point), multiplier | 1 << bits,
+                                bits, field, a_value, b_value), field)
+    else:
+        # Folding reduction has data dependent length, so the context is
+        # used by the variable-time path only
+        field = prime_field(field)
+        parameters = None
+        if order is not None:
+            parameters = find_glv_parameters(point, field, a_value, b_value,
+                                             order)
+        if parameters is not None:
+            r_point = glv_multiply(point, multiplier, field, a_value, order,
+                                   parameters)
+        elif has_fast_model(a_value, b_value, field):
+            r_point = model_multiply(point, multiplier, field, a_value,
+                                     b_value)
+        else:
+            r_point = double_and_add(point, multiplier, field, a_value)
+
+    if r_point is None:
+        raise ValueError("Got a point an eternity...")
 
-    return s_point
+    return create_point(*r_point)
 
 
 def find_point_order(point, field, a_value, b_value):
@@ -292,7 +416,8 @@ def find_point_order(point, field, a_value, b_value):
             return order
 
 
-def diffy_hellman(field, a_value, b_value, point):
+def diffy_hellman(field, a_value, b_value, point, constant_time=False,
+                  order=None):
     """
     Function performs DF-algorythm on given elliptic curve\n
     DF-algorythm step-by-step:\n
@@ -320,6 +445,8 @@ def diffy_hellman(field, a_value, b_value, point):
     :param int field: an a curve field\n
     :param int a_value: an a value in elliptic form E(a, b)\n
     :param int a_value: an b value in elliptic form E(a, b)\n
+    :param bool constant_time: use side-channel resistant ladder (optional)\n
+    :param int order: curve group order, bounds the ladder (optional)\n
 
     """
     a_comb, b_comb = int(), int()
@@ -330,10 +457,14 @@ def diffy_hellman(field, a_value, b_value, point):
     print("alhpha: ", a_comb)
     print("beta: ", b_comb)
     try:
-        a_point = multiply_point(point, a_comb, field, a_value, b_value)
-        b_point = multiply_point(point, b_comb, field, a_value, b_value)
-        a_secret = multiply_point(b_point, a_comb, field, a_value, b_value)
-        b_secret = multiply_point(a_point, b_comb, field, a_value, b_value)
+        a_point = multiply_point(point, a_comb, field, a_value, b_value,
+                                 constant_time, order)
+        b_point = multiply_point(point, b_comb, field, a_value, b_value,
+                                 constant_time, order)
+        a_secret = multiply_point(b_point, a_comb, field, a_value, b_value,
+                                  constant_time, order)
+        b_secret = multiply_point(a_point, b_comb, field, a_value, b_value,
+                                  constant_time, order)
     except ValueError:
         print("Got a point an eternity... Please, repeat DF-algorythm")
         return
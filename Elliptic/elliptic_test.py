@@ -0,0 +1,157 @@
+"""
+    Module contains unit tests for elliptic module
+
+"""
+
+import sys
+import unittest
+from random import getrandbits
+from Elliptic import projective
+from Elliptic.curves import P256, SECP256K1
+from Elliptic.elliptic import (
+    add_points,
+    create_point,
+    find_points,
+    list_points,
+    multiply_point
+)
+from Elliptic.glv import find_glv_parameters
+
+
+def repeated_addition(point, count, field, a_value, b_value):
+    # Reference multiples [O, P, 2P, ...] with None for point at infinity
+    multiples, r_point = [None], None
+    for _ in range(count):
+        if r_point is None:
+            r_point = point
+        elif (r_point.x_crd == point.x_crd and
+              (r_point.y_crd + point.y_crd) % field == 0):
+            r_point = None
+        else:
+            r_point = add_points(r_point, point, field, a_value, b_value)
+        multiples.append(r_point)
+    return multiples
+
+
+class multiply_test(unittest.TestCase):
+
+    def check_modes(self, a_value, b_value, field):
+        points = [create_point(x, y) for x, ys in
+                  find_points(a_value, b_value, field).items() for y in ys]
+        order = len(points) + 1
+        for point in points:
+            multiples = repeated_addition(point, order + 2, field,
+                                          a_value, b_value)
+            for multiplier in range(order + 2):
+                for constant_time, curve_order in ((False, None),
+                                                   (True, None),
+                                                   (True, order)):
+                    try:
+                        r_point = multiply_point(point, multiplier, field,
+                                                 a_value, b_value,
+                                                 constant_time, curve_order)
+                    except ValueError:
+                        r_point = None
+                    self.assertEqual(r_point, multiples[multiplier])
+
+    def check_order(self, a_value, b_value, field, order):
+        # Every point has the given prime order
+        for point in list_points(a_value, b_value, field):
+            multiples = repeated_addition(point, order, field, a_value,
+                                          b_value)
+            for multiplier in range(1, order):
+                for constant_time in (False, True):
+                    self.assertEqual(
+                        multiply_point(point, multiplier, field, a_value,
+                                       b_value, constant_time, order),
+                        multiples[multiplier])
+
+    def test_odd_order(self):
+        self.check_modes(1, 6, 11)
+
+    def test_even_order(self):
+        self.check_modes(3, 5, 103)
+        self.check_modes(4, 0, 17)
+
+    def test_large_curve(self):
+        curve = SECP256K1
+        for constant_time in (False, True):
+            self.assertRaises(ValueError, multiply_point, curve.point,
+                              curve.order, curve.field, curve.a_value,
+                              curve.b_value, constant_time, curve.order)
+        multiplier = 0xC0FFEE * 2 ** 200 + 12345
+        for curve in (SECP256K1, P256):
+            for value in (multiplier, multiplier + 1, curve.order - 1):
+                for order in (None, curve.order):
+                    self.assertEqual(
+                        multiply_point(curve.point, value, curve.field,
+                                       curve.a_value, curve.b_value),
+                        multiply_point(curve.point, value, curve.field,
+                                       curve.a_value, curve.b_value, True,
+                                       order))
+
+    def test_constant_inversion(self):
+        # Results of constant-time paths leave through Fermat inversion
+        exponents = list()
+
+        def recorded_pow(value, exponent, modulus):
+            if sys._getframe(1).f_code is projective.to_affine.__code__:
+                exponents.append(exponent)
+            return pow(value, exponent, modulus)
+
+        projective.pow = recorded_pow
+        try:
+            for curve in (SECP256K1, P256):
+                for order in (None, curve.order):
+                    multiply_point(curve.point, 0xC0FFEE, curve.field,
+                                   curve.a_value, curve.b_value, True, order)
+        finally:
+            del projective.pow
+        self.assertEqual(exponents, [SECP256K1.field - 2] * 2 +
+                         [P256.field - 2] * 2)
+
+    def test_glv(self):
+        for a_value, b_value, field in ((0, 5, 103), (0, 2, 139)):
+            points = [create_point(x, y) for x, ys in
+                      find_points(a_value, b_value, field).items()
+                      for y in ys]
+            order = len(points) + 1
+            for point in points:
+                multiples = repeated_addition(point, order + 2, field,
+                                              a_value, b_value)
+                for multiplier in range(1, order + 2):
+                    for constant_time in (False, True):
+                        try:
+                            r_point = multiply_point(point, multiplier, field,
+                                                     a_value, b_value,
+                                                     constant_time, order)
+                        except ValueError:
+                            r_point = None
+                        self.assertEqual(r_point, multiples[multiplier])
+
+        # Same field and order on a curve without endomorphism
+        multiply_point(create_point(2, 61), 5, 103, 0, 5, False, 97)
+        self.check_order(7, 5, 103, 97)
+        # Group Z/7 x Z/7, lambda differs on points of order 7
+        self.check_order(0, 19, 43, 7)
+        self.assertEqual(multiply_point(create_point(28, 16), 2, 43, 0, 19,
+                                        False, 7), (25, 11))
+
+        curve = SECP256K1
+        self.assertIsNotNone(find_glv_parameters(
+            curve.point, curve.field, curve.a_value, curve.b_value,
+            curve.order))
+        self.assertIsNone(find_glv_parameters(
+            P256.point, P256.field, P256.a_value, P256.b_value, P256.order))
+        for _ in range(20):
+            multiplier = getrandbits(256)
+            self.assertEqual(
+                multiply_point(curve.point, multiplier, curve.field,
+                               curve.a_value, curve.b_value),
+                multiply_point(curve.point, multiplier, curve.field,
+                               curve.a_value, curve.b_value,
+                               order=curve.order))
+
+
+if __name__ == '__main__':
+    unittest.main()
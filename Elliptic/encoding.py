@@ -0,0 +1,192 @@
+"""
+    Module contains SEC1-style point serialization functions:
+    compressed (0x02 | 0x03 + x) and uncompressed (0x04 + x + y) forms,
+    single point and bulk encoding over contiguous buffers\n
+
+"""
+
+from .elliptic import (
+    Point,
+    find_ordinate,
+    is_point_exist
+)
+from .simplicityTests import modular_sqrt
+
+
+COMPRESSED_EVEN = 0x02
+COMPRESSED_ODD = 0x03
+UNCOMPRESSED = 0x04
+
+
+def coordinate_length(field):
+
+    """
+    Function finds a number of bytes required to store one coordinate\n
+
+    :param int field: an a curve field\n
+
+    """
+
+    return (field.bit_length() + 7) // 8
+
+
+def point_length(field, compressed=True):
+
+    """
+    Function finds a number of bytes of an encoded point\n
+
+    :param int field: an a curve field\n
+    :param bool compressed: compressed or uncompressed form (optional)\n
+
+    """
+
+    if compressed:
+        return 1 + coordinate_length(field)
+    return 1 + 2 * coordinate_length(field)
+
+
+def _write_point(buffer, offset, point, field, size, compressed):
+
+    # Write an encoded point into a preallocated buffer at given offset
+    if not (0 <= point.x_crd < field and 0 <= point.y_crd < field):
+        raise ValueError("Point coordinate is out of field")
+    if compressed:
+        buffer[offset] = COMPRESSED_EVEN | (point.y_crd & 1)
+        buffer[offset + 1:offset + 1 + size] = point.x_crd.to_bytes(size, "big")
+    else:
+        buffer[offset] = UNCOMPRESSED
+        buffer[offset + 1:offset + 1 + size] = point.x_crd.to_bytes(size, "big")
+        buffer[offset + 1 + size:offset + 1 + 2 * size] = \
+            point.y_crd.to_bytes(size, "big")
+
+
+def _read_point(view, offset, size, a_value, b_value, field):
+
+    # Read an encoded point from a memoryview at given offset
+    prefix = view[offset]
+    x_crd = int.from_bytes(view[offset + 1:offset + 1 + size], "big")
+    if x_crd >= field:
+        raise ValueError("Encoded coordinate is out of field")
+
+    if prefix == UNCOMPRESSED:
+        y_crd = int.from_bytes(view[offset + 1 + size:offset + 1 + 2 * size],
+                               "big")
+        point = Point(x_crd, y_crd)
+        if not is_point_exist(point, a_value, b_value, field):
+            raise ValueError("Given point don't belong to elliptic curve")
+        return point
+
+    if prefix not in (COMPRESSED_EVEN, COMPRESSED_ODD):
+        raise ValueError("Unknown point encoding prefix")
+
+    y_crd = modular_sqrt(find_ordinate(x_crd, a_value, b_value, field), field)
+    if y_crd is None:
+        raise ValueError("Given point don't belong to elliptic curve")
+    if y_crd == 0 and prefix == COMPRESSED_ODD:
+        # Zero ordinate has no odd root, SEC1 rejects the prefix
+        raise ValueError("Encoded ordinate parity doesn't match the point")
+    # Choose the root whose parity matches the prefix
+    if (y_crd & 1) != (prefix & 1):
+        y_crd = (field - y_crd) % field
+    return Point(x_crd, y_crd)
+
+
+def encode_point(point, field, compressed=True):
+
+    """
+    Function encodes a given point into SEC1 octet string\n
+    Returns bytes of point_length(field, compressed) length\n
+
+    :param tuple point: tuple that contains coordinates of the given point\n
+    :param int field: an a curve field\n
+    :param bool compressed: compressed or uncompressed form (optional)\n
+
+    """
+
+    buffer = bytearray(point_length(field, compressed))
+    _write_point(buffer, 0, point, field, coordinate_length(field),
+                 compressed)
+    return bytes(buffer)
+
+
+def decode_point(data, a_value, b_value, field):
+
+    """
+    Function decodes a SEC1 octet string into a point of the given curve\n
+    Compressed form is decompressed with a cached square root of the field\n
+    Possible values: tuple([x_value, y_value]),
+                     ValueError (In case data is not a curve point)\n
+
+    :param bytes data: encoded point\n
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int b_value: an b value in elliptic form E(a, b)\n
+    :param int field: an a curve field\n
+
+    """
+
+    view = memoryview(data)
+    size = coordinate_length(field)
+    if not view or len(view) != point_length(field, view[0] != UNCOMPRESSED):
+        raise ValueError("Wrong encoded point length")
+    return _read_point(view, 0, size, a_value, b_value, field)
+
+
+def encode_points(points, field, compressed=True, buffer=None):
+
+    """
+    Function encodes a sequence of points into one contiguous buffer
+    of fixed-width SEC1 records\n
+    Records are written in place, into a new bytearray or into a given
+    writable buffer, which is returned without copying\n
+    Possible values: bytearray or the given buffer,
+                     ValueError (In case buffer is too short or a point
+                     coordinate is out of field)\n
+
+    :param list points: sequence of points\n
+    :param int field: an a curve field\n
+    :param bool compressed: compressed or uncompressed form (optional)\n
+    :param bytearray buffer: writable buffer of at least
+    len(points) * point_length(field, compressed) bytes (optional)\n
+
+    """
+
+    size = coordinate_length(field)
+    step = point_length(field, compressed)
+    if buffer is None:
+        buffer = bytearray(len(points) * step)
+    elif len(buffer) < len(points) * step:
+        raise ValueError("Buffer is too short for given points")
+    for index, point in enumerate(points):
+        _write_point(buffer, index * step, point, field, size, compressed)
+    return buffer
+
+
+def decode_points(data, a_value, b_value, field, compressed=True):
+
+    """
+    Function decodes a contiguous buffer of fixed-width SEC1 records
+    produced by encode_points\n
+    The buffer is read through a memoryview, so no per-record copy is made\n
+    Possible values: list of points,
+                     ValueError (In case data is malformed)\n
+
+    :param bytes data: bytes, bytearray or memoryview with encoded points\n
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int b_value: an b value in elliptic form E(a, b)\n
+    :param int field: an a curve field\n
+    :param bool compressed: compressed or uncompressed form (optional)\n
+
+    """
+
+    view = memoryview(data)
+    size = coordinate_length(field)
+    step = point_length(field, compressed)
+    if len(view) % step != 0:
+        raise ValueError("Wrong encoded points buffer length")
+
+    points = list()
+    for offset in range(0, len(view), step):
+        if (view[offset] == UNCOMPRESSED) == compressed:
+            raise ValueError("Mixed point encodings in buffer")
+        points.append(_read_point(view, offset, size, a_value, b_value, field))
+    return points
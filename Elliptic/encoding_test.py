@@ -0,0 +1,63 @@
+"""
+    Module contains unit tests for encoding module
+
+"""
+
+import pickle
+import unittest
+from Elliptic import encoding
+from Elliptic.elliptic import Point, create_point, find_points
+from Elliptic.simplicityTests import modular_sqrt
+
+
+class encoding_test(unittest.TestCase):
+
+    def test_modular_sqrt(self):
+        for field in (37, 41, 53, 97, 193):
+            for value in range(1, field):
+                root = modular_sqrt(value, field)
+                if root is not None:
+                    self.assertEqual(root * root % field, value)
+        self.assertIsNone(modular_sqrt(3, 41))
+
+    def test_point_roundtrip(self):
+        point = create_point(3, 6)
+        self.assertEqual(encoding.encode_point(point, 97), bytes([2, 3]))
+        self.assertEqual(encoding.encode_point(point, 97, False),
+                         bytes([4, 3, 6]))
+        self.assertEqual(encoding.decode_point(bytes([2, 3]), 2, 3, 97), point)
+        self.assertEqual(encoding.decode_point(bytes([4, 3, 6]), 2, 3, 97),
+                         point)
+        self.assertRaises(ValueError, encoding.decode_point,
+                          bytes([4, 3, 7]), 2, 3, 97)
+        # Point (0, 0) of order 2: only the even prefix is valid
+        self.assertEqual(encoding.decode_point(bytes([2, 0]), 4, 0, 17),
+                         create_point(0, 0))
+        self.assertRaises(ValueError, encoding.decode_point,
+                          bytes([3, 0]), 4, 0, 17)
+        for coordinates in ((97, 6), (3, -6), (3, 97)):
+            for compressed in (True, False):
+                self.assertRaises(ValueError, encoding.encode_point,
+                                  create_point(*coordinates), 97, compressed)
+
+    def test_bulk_roundtrip(self):
+        points = [create_point(x, y)
+                  for x, ys in find_points(2, 3, 193).items() for y in ys]
+        for compressed in (True, False):
+            data = encoding.encode_points(points, 193, compressed)
+            decoded = encoding.decode_points(memoryview(data), 2, 3, 193,
+                                             compressed)
+            self.assertEqual(decoded, points)
+            # Decoded points share one module level type and pickle
+            self.assertEqual({type(point) for point in decoded}, {Point})
+            self.assertEqual(pickle.loads(pickle.dumps(decoded)), points)
+            buffer = bytearray(len(data) + 1)
+            self.assertIs(encoding.encode_points(points, 193, compressed,
+                                                 buffer), buffer)
+            self.assertEqual(buffer[:-1], data)
+            self.assertRaises(ValueError, encoding.encode_points, points, 193,
+                              compressed, bytearray(len(data) - 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,265 @@
+"""
+    Module contains a prime field context for elliptic curve arithmetic\n
+    PrimeField is an int, so it is passed as field to every function of
+    the package and all "% field" and "pow(..., field)" operations use it:\n
+    -> special form primes 2^k - c (Mersenne c = 1, pseudo-Mersenne with
+    small c as 2^255 - 19 or secp256k1, Solinas with sparse c as P-256)
+    are detected. Mersenne and pseudo-Mersenne primes of FOLDING_BITS
+    and longer (P-521) are reduced by folding x = hi * 2^k + lo into
+    lo + hi * c instead of long division, on shorter primes the builtin
+    division is faster than folding written in Python\n
+    -> Montgomery constants R = 2^k, R^2 mod p and -p^-1 mod R are
+    precomputed for Montgomery representation of values\n
+    -> inversion uses extended Euclid instead of Fermat exponentiation,
+    batched inversion uses Montgomery's trick\n
+
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+
+SpecialForm = namedtuple("SpecialForm", "name shift offset")
+
+MERSENNE = "mersenne"
+PSEUDO_MERSENNE = "pseudo-mersenne"
+SOLINAS = "solinas"
+
+# Maximal number of signed powers of two in offset of Solinas prime
+SOLINAS_TERMS = 5
+# Folding in Python outruns long division from this prime length only
+FOLDING_BITS = 500
+
+
+def find_special_form(field):
+
+    """
+    Function finds special form field = 2^shift - offset of a prime\n
+    Possible values: SpecialForm, None (In case prime is generic)\n
+
+    :param int field: an a curve field\n
+
+    """
+
+    shift = field.bit_length()
+    offset = (1 << shift) - field
+    if offset == 1:
+        return SpecialForm(MERSENNE, shift, offset)
+    if offset.bit_length() <= shift // 2:
+        return SpecialForm(PSEUDO_MERSENNE, shift, offset)
+
+    # Weight of non-adjacent form of offset
+    terms, value = 0, offset
+    while value:
+        if value & 1:
+            value -= 2 - (value & 3)
+            terms += 1
+        value >>= 1
+    if terms <= SOLINAS_TERMS:
+        return SpecialForm(SOLINAS, shift, offset)
+    return None
+
+
+def batch_inverse(values, field):
+
+    """
+    Function inverts every value of a list modulo field with one modular
+    inversion (Montgomery's trick)\n
+    Values must be non zero modulo field\n
+
+    :param list values: values to invert\n
+    :param int field: an a curve field\n
+
+    """
+
+    prefix = [1] * len(values)
+    accumulator = 1
+    for index, value in enumerate(values):
+        prefix[index] = accumulator
+        accumulator = accumulator * value % field
+
+    inverse = pow(accumulator, -1, field)
+    inverses = [0] * len(values)
+    for index in range(len(values) - 1, -1, -1):
+        inverses[index] = prefix[index] * inverse % field
+        inverse = inverse * values[index] % field
+    return inverses
+
+
+def batch_power(values, exponent, field):
+
+    """
+    Function raises every value of a list to the same exponent modulo
+    field, negative exponent inverts the values in one batch first\n
+
+    :param list values: values to raise\n
+    :param int exponent: int exponent\n
+    :param int field: an a curve field\n
+
+    """
+
+    if exponent < 0:
+        values, exponent = batch_inverse(values, field), -exponent
+    return [pow(value, exponent, field) for value in values]
+
+
+class PrimeField(int):
+
+    """
+    Prime field context, an int equal to the prime with precomputed
+    reduction and Montgomery constants\n
+    Use prime_field to get a shared context of a prime\n
+
+    """
+
+    def __new__(cls, field):
+        self = super().__new__(cls, field)
+        self.bits = field.bit_length()
+        self.special_form = find_special_form(field)
+
+        # Montgomery constants, R = 2^bits > field, field must be odd
+        self.r_mask = (1 << self.bits) - 1
+        self.r_square = pow(1 << self.bits, 2, field)
+        self.p_prime = None
+        if field & 1:
+            self.p_prime = -pow(field, -1, 1 << self.bits) & self.r_mask
+        return self
+
+    def __repr__(self):
+        return "PrimeField({0})".format(int(self))
+
+    def inverse(self, value):
+
+        """
+        Method finds an inverse of a value\n
+        Possible values: 1 .. field - 1,
+                         ZeroDivisionError (In case value is zero)\n
+
+        :param int value: value to invert\n
+
+        """
+
+        if value % self == 0:
+            raise ZeroDivisionError("Impossible inverse")
+        return pow(value, -1, self)
+
+    def batch_inverse(self, values):
+
+        """
+        Method inverts every value of a list with one inversion\n
+
+        :param list values: non zero values to invert\n
+
+        """
+
+        return batch_inverse(values, self)
+
+    def power(self, value, exponent):
+
+        """
+        Method raises a value to an exponent, negative exponents allowed\n
+
+        :param int value: value to raise\n
+        :param int exponent: int exponent\n
+
+        """
+
+        return pow(value, exponent, self)
+
+    def batch_power(self, values, exponent):
+
+        """
+        Method raises every value of a list to the same exponent\n
+
+        :param list values: values to raise\n
+        :param int exponent: int exponent\n
+
+        """
+
+        return batch_power(values, exponent, self)
+
+    def montgomery_reduce(self, value):
+
+        """
+        Method finds value / R modulo field (REDC)\n
+
+        :param int value: value in range 0 .. field * R - 1\n
+
+        """
+
+        factor = (value & self.r_mask) * self.p_prime & self.r_mask
+        value = (value + factor * self) >> self.bits
+        return value - self if value >= self else value
+
+    def to_montgomery(self, value):
+
+        """
+        Method converts a value into Montgomery representation value * R\n
+
+        :param int value: value in range 0 .. field - 1\n
+
+        """
+
+        return self.montgomery_reduce(value * self.r_square)
+
+    def from_montgomery(self, value):
+
+        """
+        Method converts a value from Montgomery representation\n
+
+        :param int value: value in Montgomery representation\n
+
+        """
+
+        return self.montgomery_reduce(value)
+
+    def montgomery_multiply(self, f_value, s_value):
+
+        """
+        Method multiplies two values in Montgomery representation\n
+
+        :param int f_value: value in Montgomery representation\n
+        :param int s_value: value in Montgomery representation\n
+
+        """
+
+        return self.montgomery_reduce(f_value * s_value)
+
+
+class FoldingField(PrimeField):
+
+    """
+    Prime field context of 2^k - c prime with small c, "value % field"
+    folds high bits of value instead of long division\n
+
+    """
+
+    def __rmod__(self, value):
+        if type(value) is not int:
+            return int.__rmod__(self, value)
+        shift, offset, mask = self.bits, self.special_form.offset, self.r_mask
+        high = value >> shift
+        while high:
+            value = (value & mask) + high * offset
+            high = value >> shift
+        return value - self if value >= self else value
+
+
+@lru_cache(maxsize=None)
+def prime_field(field):
+
+    """
+    Function creates a context of a prime field once and caches it\n
+    Long Mersenne and pseudo-Mersenne primes get folding reduction\n
+
+    :param int field: an a curve field, prime\n
+
+    """
+
+    if isinstance(field, PrimeField):
+        return field
+    form = find_special_form(field)
+    if (form is not None and form.name in (MERSENNE, PSEUDO_MERSENNE) and
+            field.bit_length() >= FOLDING_BITS):
+        return FoldingField(field)
+    return PrimeField(field)
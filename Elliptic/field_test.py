@@ -0,0 +1,105 @@
+"""
+    Module contains unit tests for field module
+
+"""
+
+import pickle
+import unittest
+from random import Random
+from Elliptic import field
+from Elliptic.elliptic import (
+    add_points,
+    create_point,
+    is_point_exist,
+    multiply_point
+)
+from Elliptic.curves import (
+    P256,
+    SECP256K1
+)
+from Elliptic.projective import double_and_add
+
+
+P521 = 2 ** 521 - 1
+
+
+class field_test(unittest.TestCase):
+
+    def test_special_form(self):
+        self.assertEqual(field.find_special_form(P521).name, field.MERSENNE)
+        self.assertEqual(field.find_special_form(SECP256K1.field),
+                         (field.PSEUDO_MERSENNE, 256, 2 ** 32 + 977))
+        self.assertEqual(field.find_special_form(2 ** 255 - 19).name,
+                         field.PSEUDO_MERSENNE)
+        self.assertEqual(field.find_special_form(P256.field).name,
+                         field.SOLINAS)
+        self.assertIsNone(field.find_special_form(SECP256K1.order))
+        self.assertIsInstance(field.prime_field(P521), field.FoldingField)
+        self.assertNotIsInstance(field.prime_field(SECP256K1.field),
+                                 field.FoldingField)
+
+    def test_reduction(self):
+        rng = Random(0)
+        for prime in (P521, 2 ** 511 - 187, SECP256K1.field, P256.field):
+            context = field.prime_field(prime)
+            self.assertEqual(context, prime)
+            self.assertEqual(pickle.loads(pickle.dumps(context)), context)
+            for _ in range(200):
+                value = rng.randrange(-4 * prime * prime, 4 * prime * prime)
+                self.assertEqual(value % context, value % prime)
+                residue = value % prime
+                montgomery = context.to_montgomery(residue)
+                self.assertEqual(montgomery, (residue << context.bits) % prime)
+                self.assertEqual(context.from_montgomery(montgomery), residue)
+                self.assertEqual(context.from_montgomery(
+                    context.montgomery_multiply(montgomery, montgomery)),
+                    residue * residue % prime)
+
+    def test_batch(self):
+        context = field.prime_field(P256.field)
+        rng = Random(1)
+        values = [rng.randrange(1, P256.field) for _ in range(20)]
+        for value, inverse in zip(values, context.batch_inverse(values)):
+            self.assertEqual(value * inverse % P256.field, 1)
+            self.assertEqual(context.inverse(value), inverse)
+        self.assertEqual(context.batch_power(values, -3),
+                         [pow(value, -3, P256.field) for value in values])
+        self.assertEqual(context.batch_power(values, 5),
+                         [context.power(value, 5) for value in values])
+        self.assertRaises(ZeroDivisionError, context.inverse, P256.field)
+
+    def test_curve_arithmetic(self):
+        # Curve y^2 = x^3 - 3*x + b through point (1, 2^300 + 7)
+        point, a_value = (1, 2 ** 300 + 7), -3
+        context = field.prime_field(P521)
+        for multiplier in (2, 3, 2 ** 520 + 12345):
+            self.assertEqual(double_and_add(point, multiplier, context,
+                                            a_value),
+                             double_and_add(point, multiplier, P521, a_value))
+
+    def test_folding_points(self):
+        # Points of P521 sized field reach FoldingField through elliptic API
+        point, a_value = create_point(1, 2 ** 300 + 7), -3
+        b_value = (point.y_crd ** 2 - 1 - a_value) % P521
+        double = multiply_point(point, 2, P521, a_value, b_value)
+        alpha = (3 + a_value) * pow(2 * point.y_crd, -1, P521) % P521
+        x_value = (alpha * alpha - 2) % P521
+        self.assertEqual(double, (x_value,
+                                  (alpha * (1 - x_value) - point.y_crd) %
+                                  P521))
+        self.assertEqual(add_points(point, point, P521, a_value, b_value),
+                         double)
+        triple = add_points(point, double, P521, a_value, b_value)
+        self.assertEqual(triple, double_and_add(point, 3, P521, a_value))
+        for multiplier in (3, 2 ** 520 + 12345, P521 - 2):
+            expected = double_and_add(point, multiplier, P521, a_value)
+            for constant_time in (False, True):
+                result = multiply_point(point, multiplier, P521, a_value,
+                                        b_value, constant_time)
+                self.assertEqual(result, expected)
+                self.assertTrue(is_point_exist(result, a_value, b_value,
+                                               P521))
+
+
+if __name__ == '__main__':
+    unittest.main()
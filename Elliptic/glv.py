@@ -0,0 +1,285 @@
+"""
+    Module contains GLV (Gallant-Lambert-Vanstone) scalar multiplication
+    for curves of the following form: y^2 = x^3 + b over field = 1 mod 3\n
+    Such curves have the endomorphism (x, y) -> (beta*x, y), beta^3 = 1,
+    acting on points of prime order n as multiplication by lambda,
+    lambda^3 = 1 mod n. Multiplier k is split into k1 + k2*lambda with
+    half-length k1, k2 that are processed simultaneously\n
+
+"""
+
+from math import isqrt
+from sympy import isprime
+from .projective import (
+    JACOBIAN_INFINITY,
+    WINDOW_BITS,
+    complete_add,
+    complete_double,
+    double_and_add,
+    jacobian_add_affine,
+    jacobian_double,
+    jacobian_to_affine,
+    odd_multiples,
+    regular_digits,
+    select_entry,
+    table_lookup
+)
+from .simplicityTests import modular_sqrt
+
+
+# Parameters found for (field, a_value, b_value, order), None if GLV
+# doesn't apply
+GLV_PARAMETERS = dict()
+
+
+def has_endomorphism(a_value, field):
+
+    """
+    Function determines whether a curve has an efficiently computable
+    endomorphism of order 3 (a = 0 and field = 1 mod 3)\n
+    Possible values: True, False\n
+
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int field: an a curve field\n
+
+    """
+
+    return a_value % field == 0 and field % 3 == 1
+
+
+def find_cube_root_of_unity(modulus):
+
+    """
+    Function finds a non-trivial cube root of unity modulo prime
+    modulus = 1 mod 3 as (-1 + sqrt(-3)) / 2, the other one is its
+    square\n
+
+    :param int modulus: prime modulus\n
+
+    """
+
+    root = modular_sqrt(-3, modulus)
+    return (root - 1) * pow(2, -1, modulus) % modulus
+
+
+def find_lattice_basis(order, lambda_value):
+
+    """
+    Function finds two short vectors (a1, b1), (a2, b2) of the lattice
+    {(x, y): x + y*lambda = 0 mod order} with extended Euclidean algorithm
+    (algorithm 3.74 of Guide to Elliptic Curve Cryptography)\n
+
+    :param int order: prime order of the point\n
+    :param int lambda_value: eigenvalue of the endomorphism\n
+
+    """
+
+    # Remainders r_i = s_i * order + t_i * lambda, stop below sqrt(order)
+    remainders, t_values = [order, lambda_value], [0, 1]
+    while remainders[-1] ** 2 >= order:
+        quotient = remainders[-2] // remainders[-1]
+        remainders.append(remainders[-2] - quotient * remainders[-1])
+        t_values.append(t_values[-2] - quotient * t_values[-1])
+    quotient = remainders[-2] // remainders[-1]
+    remainders.append(remainders[-2] - quotient * remainders[-1])
+    t_values.append(t_values[-2] - quotient * t_values[-1])
+
+    # remainders[-3] is the last one not below sqrt(order)
+    f_vector = (remainders[-2], -t_values[-2])
+    if (remainders[-3] ** 2 + t_values[-3] ** 2 <=
+            remainders[-1] ** 2 + t_values[-1] ** 2):
+        s_vector = (remainders[-3], -t_values[-3])
+    else:
+        s_vector = (remainders[-1], -t_values[-1])
+    return f_vector, s_vector
+
+
+def decompose_multiplier(multiplier, order, basis):
+
+    """
+    Function splits a multiplier into k1, k2 of about half bit length
+    such that multiplier = k1 + k2*lambda mod order\n
+
+    :param int multiplier: int coefficient\n
+    :param int order: prime order of the point\n
+    :param tuple basis: lattice basis from find_lattice_basis\n
+
+    """
+
+    (a1_value, b1_value), (a2_value, b2_value) = basis
+    # Rounded divisions round(x / order) in integers
+    c1_value = (2 * b2_value * multiplier + order) // (2 * order)
+    c2_value = (-2 * b1_value * multiplier + order) // (2 * order)
+    k1_value = multiplier - c1_value * a1_value - c2_value * a2_value
+    k2_value = -c1_value * b1_value - c2_value * b2_value
+    return k1_value, k2_value
+
+
+def find_glv_parameters(point, field, a_value, b_value, order):
+
+    """
+    Function finds GLV parameters (beta, lambda, basis) of a curve once and
+    caches them in GLV_PARAMETERS\n
+    beta and lambda are matched on the given point, which must have the
+    given prime order. If order^2 may divide the curve order (order^2 is
+    within Hasse bound p + 1 + 2*sqrt(p)), points of that order needn't
+    share lambda, so parameters are matched on every point uncached\n
+    Possible values: tuple([beta, lambda, basis]),
+                     None (In case curve has no suitable endomorphism)\n
+
+    :param tuple point: tuple that contains coordinates of the given point\n
+    :param int field: an a curve field\n
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int b_value: an b value in elliptic form E(a, b)\n
+    :param int order: prime order of the point\n
+
+    """
+
+    key = (field, a_value % field, b_value % field, order)
+    cyclic = order * order > field + 1 + isqrt(4 * field)
+    if cyclic and key in GLV_PARAMETERS:
+        return GLV_PARAMETERS[key]
+
+    parameters = None
+    if (has_endomorphism(a_value, field) and order % 3 == 1 and
+            order > 3 and isprime(order)):
+        lambda_value = find_cube_root_of_unity(order)
+        target = double_and_add(point, lambda_value, field, a_value)
+        beta = find_cube_root_of_unity(field)
+        for candidate in (beta, beta * beta % field):
+            if target == (candidate * point.x_crd % field, point.y_crd):
+                parameters = (candidate, lambda_value,
+                              find_lattice_basis(order, lambda_value))
+
+    if cyclic:
+        GLV_PARAMETERS[key] = parameters
+    return parameters
+
+
+def glv_multiply(point, multiplier, field, a_value, order, parameters):
+
+    """
+    Function finds a composition of a point on given multiplier as
+    k1*P + k2*phi(P) with simultaneous (Shamir's trick) double-and-add
+    in Jacobian coordinates\n
+    Possible values: tuple([x_value, y_value]),
+                     None (In case point at infinity)\n
+
+    :param tuple point: tuple that contains coordinates of the given point\n
+    :param int multiplier: int coefficient\n
+    :param int field: an a curve field\n
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int order: prime order of the point\n
+    :param tuple parameters: result of find_glv_parameters\n
+
+    """
+
+    beta, _, basis = parameters
+    k1_value, k2_value = decompose_multiplier(multiplier % order, order, basis)
+
+    f_point = (point.x_crd, point.y_crd if k1_value >= 0 else
+               -point.y_crd % field)
+    s_point = (beta * point.x_crd % field, point.y_crd if k2_value >= 0 else
+               -point.y_crd % field)
+    k1_value, k2_value = abs(k1_value), abs(k2_value)
+
+    # Precomputed P + phi(P), None if it is point at infinity
+    sum_point = jacobian_to_affine(
+        jacobian_add_affine(f_point + (1,), s_point[0], s_point[1],
+                            field, a_value), field)
+    table = (None, f_point, s_point, sum_point)
+
+    result = JACOBIAN_INFINITY
+    for index in range(max(k1_value, k2_value).bit_length() - 1, -1, -1):
+        result = jacobian_double(result, field, a_value)
+        addend = table[((k1_value >> index) & 1) |
+                       ((k2_value >> index) & 1) << 1]
+        if addend is not None:
+            result = jacobian_add_affine(result, addend[0], addend[1],
+                                         field, a_value)
+    return jacobian_to_affine(result, field)
+
+
+def find_decomposition_bits(basis):
+
+    """
+    Function finds a bit length bound of |k1|, |k2| produced by
+    decompose_multiplier: rounding errors are at most 1/2, so k1 and k2
+    are bounded by the largest basis component\n
+
+    :param tuple basis: lattice basis from find_lattice_basis\n
+
+    """
+
+    return max(abs(value) for vector in basis for value in vector).bit_length()
+
+
+def glv_window_multiply(point, multiplier, field, a_value, b_value, order,
+                        parameters):
+
+    """
+    Function finds a composition of a point on given multiplier as
+    k1*P + k2*phi(P) with fixed-window method over regular signed digits
+    of both half-length multipliers: 4 complete doublings and two complete
+    additions of masked table entries per window\n
+    Signs of k1, k2 are applied with masks. Regular digits need odd
+    multipliers, so c = 1 + (k & 1) is added to k1, k2 and the non-zero
+    c1*P + c2*phi(P) is subtracted afterwards. The number of windows
+    depends on the basis only\n
+    Returns a projective (X, Y, Z) tuple\n
+
+    :param tuple point: tuple that contains coordinates of the given point\n
+    :param int multiplier: int coefficient\n
+    :param int field: an a curve field\n
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int b_value: an b value in elliptic form E(a, b)\n
+    :param int order: odd prime order of the point\n
+    :param tuple parameters: result of find_glv_parameters\n
+
+    """
+
+    beta, _, basis = parameters
+    bits = find_decomposition_bits(basis)
+    k1_value, k2_value = decompose_multiplier(multiplier % order, order, basis)
+    # -1 for negative multiplier, 0 otherwise
+    f_sign, s_sign = k1_value >> bits + 1, k2_value >> bits + 1
+    k1_value = (k1_value ^ f_sign) - f_sign
+    k2_value = (k2_value ^ s_sign) - s_sign
+    f_odd, s_odd = k1_value & 1, k2_value & 1
+    k1_value += 1 + f_odd
+    k2_value += 1 + s_odd
+
+    b3_value = 3 * b_value % field
+    y_value = point.y_crd
+    y_value ^= (y_value ^ (field - y_value)) & f_sign
+    f_table = odd_multiples((point.x_crd, y_value, 1), field, a_value,
+                            b3_value)
+    # phi(i*P) = (beta*X, Y, Z), negated if signs differ
+    s_table = list()
+    for x_entry, y_entry, z_entry in f_table:
+        y_entry ^= (y_entry ^ (field - y_entry)) & (f_sign ^ s_sign)
+        s_table.append((beta * x_entry % field, y_entry, z_entry))
+
+    f_digits = regular_digits(k1_value, -(-(bits + 1) // WINDOW_BITS) + 1)
+    s_digits = regular_digits(k2_value, len(f_digits))
+    result = complete_add(table_lookup(f_table, f_digits[0], field),
+                          table_lookup(s_table, s_digits[0], field),
+                          field, a_value, b3_value)
+    for f_digit, s_digit in zip(f_digits[1:], s_digits[1:]):
+        for _ in range(WINDOW_BITS):
+            result = complete_double(result, field, a_value, b3_value)
+        result = complete_add(result, table_lookup(f_table, f_digit, field),
+                              field, a_value, b3_value)
+        result = complete_add(result, table_lookup(s_table, s_digit, field),
+                              field, a_value, b3_value)
+
+    # c1*P + c2*phi(P) for c1, c2 in 1, 2, never point at infinity as
+    # lambda isn't -1, -2 or -1/2 modulo prime order
+    f_double = complete_double(f_table[0], field, a_value, b3_value)
+    s_double = complete_double(s_table[0], field, a_value, b3_value)
+    corrections = [complete_add(f_entry, s_entry, field, a_value, b3_value)
+                   for s_entry in (s_table[0], s_double)
+                   for f_entry in (f_table[0], f_double)]
+    x_crd, y_crd, z_crd = select_entry(corrections, f_odd | s_odd << 1)
+    return complete_add(result, (x_crd, field - y_crd, z_crd),
+                        field, a_value, b3_value)
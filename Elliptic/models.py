@@ -0,0 +1,387 @@
+"""
+    Module contains Montgomery and twisted Edwards curve models with
+    birational maps to short Weierstrass curves y^2 = x^3 + a*x + b\n
+    -> Montgomery: B*v^2 = u^3 + A*u^2 + u, x-only ladder\n
+    -> twisted Edwards: a*x^2 + y^2 = 1 + d*x^2*y^2, unified inversion-free
+    addition in extended coordinates (X:Y:Z:T), x = X/Z, y = Y/Z, T = XY/Z\n
+    A Weierstrass curve has these forms iff x^3 + a*x + b has a root alpha
+    with 3*alpha^2 + a being a square, so curves of prime order have none\n
+
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+from random import Random
+from .field import batch_inverse
+from .polynomial import find_poly_roots
+from .simplicityTests import modular_sqrt
+
+
+MontgomeryForm = namedtuple("MontgomeryForm", "a_value b_value alpha scale")
+EdwardsForm = namedtuple("EdwardsForm", "a_value d_value")
+
+EDWARDS_NEUTRAL = (0, 1, 1, 0)
+
+
+def inverse(value, field):
+
+    """
+    Function finds an inverse of a value modulo prime field\n
+
+    :param int value: value not divisible by field\n
+    :param int field: an a curve field\n
+
+    """
+
+    return pow(value, -1, field)
+
+
+@lru_cache(maxsize=None)
+def has_order_two_point(a_value, b_value, field):
+
+    """
+    Function determines whether a curve has a point of order 2, that is
+    whether x^3 + a*x + b has a root in the field\n
+    Possible values: True, False\n
+
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int b_value: an b value in elliptic form E(a, b)\n
+    :param int field: an a curve field, greater than 3\n
+
+    """
+
+    return bool(find_poly_roots([b_value, a_value, 0, 1], field,
+                                Random(field)))
+
+
+@lru_cache(maxsize=None)
+def find_montgomery_form(a_value, b_value, field):
+
+    """
+    Function finds Montgomery form of a Weierstrass curve: for a root alpha
+    of x^3 + a*x + b with 3*alpha^2 + a = 1 / s^2 it is
+    A = 3*alpha*s, B = s, u = s*(x - alpha), v = s*y\n
+    Possible values: MontgomeryForm, None (In case form doesn't exist)\n
+
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int b_value: an b value in elliptic form E(a, b)\n
+    :param int field: an a curve field, greater than 3\n
+
+    """
+
+    for alpha in sorted(find_poly_roots([b_value, a_value, 0, 1], field,
+                                        Random(field))):
+        root = modular_sqrt(3 * alpha * alpha + a_value, field)
+        if root:
+            scale = inverse(root, field)
+            return MontgomeryForm(3 * alpha * scale % field, scale,
+                                  alpha, scale)
+    return None
+
+
+@lru_cache(maxsize=None)
+def find_edwards_form(a_value, b_value, field):
+
+    """
+    Function finds twisted Edwards form of a Weierstrass curve through its
+    Montgomery form: a = (A + 2) / B, d = (A - 2) / B\n
+    Addition is complete if a is a square and d is not\n
+    Possible values: EdwardsForm, None (In case form doesn't exist)\n
+
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int b_value: an b value in elliptic form E(a, b)\n
+    :param int field: an a curve field, greater than 3\n
+
+    """
+
+    form = find_montgomery_form(a_value, b_value, field)
+    if form is None:
+        return None
+    scale = inverse(form.b_value, field)
+    return EdwardsForm((form.a_value + 2) * scale % field,
+                       (form.a_value - 2) * scale % field)
+
+
+def weierstrass_to_montgomery(point, form, field):
+
+    """
+    Function maps an affine Weierstrass point (or None) to Montgomery\n
+
+    :param tuple point: (x, y) tuple or None for point at infinity\n
+    :param MontgomeryForm form: Montgomery form of the curve\n
+    :param int field: an a curve field\n
+
+    """
+
+    if point is None:
+        return None
+    return (form.scale * (point[0] - form.alpha) % field,
+            form.scale * point[1] % field)
+
+
+def montgomery_to_weierstrass(point, form, field):
+
+    """
+    Function maps an affine Montgomery point (or None) to Weierstrass\n
+
+    :param tuple point: (u, v) tuple or None for point at infinity\n
+    :param MontgomeryForm form: Montgomery form of the curve\n
+    :param int field: an a curve field\n
+
+    """
+
+    if point is None:
+        return None
+    scale = inverse(form.scale, field)
+    return ((point[0] * scale + form.alpha) % field, point[1] * scale % field)
+
+
+def montgomery_to_edwards(point, field):
+
+    """
+    Function maps an affine Montgomery point (or None) to twisted Edwards:
+    (u, v) -> (u / v, (u - 1) / (u + 1))\n
+    Possible values: tuple([x, y]),
+                     ValueError (In case v = 0 or u = -1 apart from (0, 0),
+                     the map is undefined)\n
+
+    :param tuple point: (u, v) tuple or None for point at infinity\n
+    :param int field: an a curve field\n
+
+    """
+
+    if point is None:
+        return (0, 1)
+    if point == (0, 0):
+        return (0, field - 1)
+    if point[1] == 0 or (point[0] + 1) % field == 0:
+        raise ValueError("Point has no image in twisted Edwards form")
+    return (point[0] * inverse(point[1], field) % field,
+            (point[0] - 1) * inverse(point[0] + 1, field) % field)
+
+
+def edwards_to_montgomery(point, field):
+
+    """
+    Function maps an affine twisted Edwards point to Montgomery:
+    (x, y) -> ((1 + y) / (1 - y), u / x)\n
+    Possible values: tuple([u, v]), None (In case point at infinity)\n
+
+    :param tuple point: (x, y) tuple\n
+    :param int field: an a curve field\n
+
+    """
+
+    x_value, y_value = point
+    if x_value == 0:
+        return None if y_value == 1 else (0, 0)
+    u_value = (1 + y_value) * inverse(1 - y_value, field) % field
+    return (u_value, u_value * inverse(x_value, field) % field)
+
+
+def montgomery_ladder(u_value, multiplier, a_value, field):
+
+    """
+    Function finds u coordinates of k*P and (k+1)*P with x-only
+    Montgomery ladder (RFC 7748 step formulas)\n
+    Returns projective (X_k, Z_k, X_k+1, Z_k+1), Z = 0 is point at infinity\n
+
+    :param int u_value: u coordinate of P\n
+    :param int multiplier: non-negative int coefficient\n
+    :param int a_value: an A value in Montgomery form\n
+    :param int field: an a curve field\n
+
+    """
+
+    a24_value = (a_value - 2) * inverse(4, field) % field
+    x2_value, z2_value, x3_value, z3_value = 1, 0, u_value, 1
+    for index in range(multiplier.bit_length() - 1, -1, -1):
+        if (multiplier >> index) & 1:
+            x2_value, x3_value = x3_value, x2_value
+            z2_value, z3_value = z3_value, z2_value
+        sum_value = x2_value + z2_value
+        sum_square = sum_value * sum_value % field
+        difference = x2_value - z2_value
+        difference_square = difference * difference % field
+        e_value = sum_square - difference_square
+        da_value = (x3_value - z3_value) * sum_value % field
+        cb_value = (x3_value + z3_value) * difference % field
+        x3_value = (da_value + cb_value) ** 2 % field
+        z3_value = u_value * (da_value - cb_value) ** 2 % field
+        x2_value = sum_square * difference_square % field
+        z2_value = e_value * (sum_square + a24_value * e_value) % field
+        if (multiplier >> index) & 1:
+            x2_value, x3_value = x3_value, x2_value
+            z2_value, z3_value = z3_value, z2_value
+    return x2_value, z2_value, x3_value, z3_value
+
+
+def montgomery_multiply(point, multiplier, form, field):
+
+    """
+    Function finds k*P on a Montgomery curve with x-only ladder and
+    recovers v coordinate (Okeya-Sakurai formula) from P, u(kP) and
+    u((k+1)P)\n
+    Possible values: tuple([u, v]), None (In case point at infinity)\n
+
+    :param tuple point: (u, v) tuple\n
+    :param int multiplier: non-negative int coefficient\n
+    :param MontgomeryForm form: Montgomery form of the curve\n
+    :param int field: an a curve field\n
+
+    """
+
+    u_value, v_value = point
+    if v_value == 0:
+        return point if multiplier & 1 else None
+
+    x_value, z_value, nx_value, nz_value = montgomery_ladder(
+        u_value, multiplier, form.a_value, field)
+    if z_value == 0:
+        return None
+    if nz_value == 0:
+        return (u_value, -v_value % field)
+
+    z_inverse, nz_inverse, denominator = batch_inverse(
+        [z_value, nz_value, 2 * form.b_value * v_value], field)
+    ku_value = x_value * z_inverse % field
+    nu_value = nx_value * nz_inverse % field
+    numerator = ((u_value * ku_value + 1) *
+                 (u_value + ku_value + 2 * form.a_value) - 2 * form.a_value -
+                 (u_value - ku_value) ** 2 * nu_value)
+    kv_value = numerator * denominator % field
+    return (ku_value, kv_value)
+
+
+def edwards_add(f_point, s_point, form, field):
+
+    """
+    Function finds a sum of two extended twisted Edwards points with
+    unified addition (add-2008-hwcd), doubling is handled as well\n
+
+    :param tuple f_point: (X, Y, Z, T) tuple\n
+    :param tuple s_point: (X, Y, Z, T) tuple\n
+    :param EdwardsForm form: twisted Edwards form of the curve\n
+    :param int field: an a curve field\n
+
+    """
+
+    x1, y1, z1, t1 = f_point
+    x2, y2, z2, t2 = s_point
+    a_value = x1 * x2 % field
+    b_value = y1 * y2 % field
+    c_value = form.d_value * t1 * t2 % field
+    d_value = z1 * z2 % field
+    e_value = ((x1 + y1) * (x2 + y2) - a_value - b_value) % field
+    f_value = d_value - c_value
+    g_value = d_value + c_value
+    h_value = b_value - form.a_value * a_value
+    return (e_value * f_value % field, g_value * h_value % field,
+            f_value * g_value % field, e_value * h_value % field)
+
+
+def edwards_double(point, form, field):
+
+    """
+    Function doubles an extended twisted Edwards point (dbl-2008-hwcd)\n
+
+    :param tuple point: (X, Y, Z, T) tuple\n
+    :param EdwardsForm form: twisted Edwards form of the curve\n
+    :param int field: an a curve field\n
+
+    """
+
+    x_value, y_value, z_value, _ = point
+    a_value = x_value * x_value % field
+    b_value = y_value * y_value % field
+    c_value = 2 * z_value * z_value
+    d_value = form.a_value * a_value
+    e_value = ((x_value + y_value) ** 2 - a_value - b_value) % field
+    g_value = (d_value + b_value) % field
+    f_value = g_value - c_value
+    h_value = d_value - b_value
+    return (e_value * f_value % field, g_value * h_value % field,
+            f_value * g_value % field, e_value * h_value % field)
+
+
+def edwards_multiply(point, multiplier, form, field):
+
+    """
+    Function finds k*P on a twisted Edwards curve with double-and-add in
+    extended coordinates\n
+    Returns an affine (x, y) tuple, neutral point is (0, 1)\n
+    Possible values: tuple([x, y]),
+                     ValueError (In case an exceptional pair was added,
+                     only if the form is not complete)\n
+
+    :param tuple point: affine (x, y) tuple\n
+    :param int multiplier: non-negative int coefficient\n
+    :param EdwardsForm form: twisted Edwards form of the curve\n
+    :param int field: an a curve field\n
+
+    """
+
+    addend = (point[0], point[1], 1, point[0] * point[1] % field)
+    result = EDWARDS_NEUTRAL
+    for index in range(multiplier.bit_length() - 1, -1, -1):
+        result = edwards_double(result, form, field)
+        if (multiplier >> index) & 1:
+            result = edwards_add(result, addend, form, field)
+    if result[2] == 0:
+        raise ValueError("Got an exceptional pair of points")
+    scale = inverse(result[2], field)
+    return (result[0] * scale % field, result[1] * scale % field)
+
+
+def is_complete_form(form, field):
+
+    """
+    Function determines whether unified addition of a twisted Edwards form
+    is complete, i.e. a is a square and d is not\n
+    Possible values: True, False\n
+
+    :param EdwardsForm form: twisted Edwards form of the curve\n
+    :param int field: an a curve field\n
+
+    """
+
+    return (modular_sqrt(form.a_value, field) not in (None, 0) and
+            modular_sqrt(form.d_value, field) is None)
+
+
+def has_fast_model(a_value, b_value, field):
+
+    """
+    Function determines whether a Weierstrass curve has Montgomery form,
+    whose ladder is the fastest available scalar multiplication\n
+    Possible values: True, False\n
+
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int b_value: an b value in elliptic form E(a, b)\n
+    :param int field: an a curve field\n
+
+    """
+
+    return field > 3 and find_montgomery_form(a_value % field, b_value % field,
+                                              field) is not None
+
+
+def model_multiply(point, multiplier, field, a_value, b_value):
+
+    """
+    Function finds k*P of a Weierstrass point in Montgomery form and maps
+    the result back\n
+    Possible values: tuple([x, y]), None (In case point at infinity)\n
+
+    :param tuple point: tuple that contains coordinates of the given point\n
+    :param int multiplier: non-negative int coefficient\n
+    :param int field: an a curve field\n
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int b_value: an b value in elliptic form E(a, b)\n
+
+    """
+
+    form = find_montgomery_form(a_value % field, b_value % field, field)
+    return montgomery_to_weierstrass(
+        montgomery_multiply(weierstrass_to_montgomery(point, form, field),
+                            multiplier, form, field), form, field)
@@ -0,0 +1,61 @@
+"""
+    Module contains unit tests for models module
+
+"""
+
+import unittest
+from Elliptic import models
+from Elliptic.elliptic import list_points
+from Elliptic.projective import double_and_add
+
+
+class models_test(unittest.TestCase):
+
+    def test_forms(self):
+        # Order of y^2 = x^3 + 2*x + 40 over 1000003 is prime
+        self.assertFalse(models.has_fast_model(2, 40, 1000003))
+        for a_value, b_value, field in ((3, 5, 103), (4, 0, 17), (1, 6, 17)):
+            self.assertTrue(models.has_fast_model(a_value, b_value, field))
+            form = models.find_montgomery_form(a_value, b_value, field)
+            for point in list_points(a_value, b_value, field):
+                u_value, v_value = models.weierstrass_to_montgomery(
+                    point, form, field)
+                self.assertEqual(
+                    (form.b_value * v_value ** 2 - u_value ** 3 -
+                     form.a_value * u_value ** 2 - u_value) % field, 0)
+                self.assertEqual(models.montgomery_to_weierstrass(
+                    (u_value, v_value), form, field), point)
+
+    def test_montgomery_multiply(self):
+        for a_value, b_value, field in ((3, 5, 103), (4, 0, 17), (1, 6, 17)):
+            for point in list_points(a_value, b_value, field):
+                for multiplier in range(30):
+                    self.assertEqual(
+                        models.model_multiply(point, multiplier, field,
+                                              a_value, b_value),
+                        double_and_add(point, multiplier, field, a_value))
+
+    def test_edwards_multiply(self):
+        a_value, b_value, field = 1, 2, 17
+        form = models.find_montgomery_form(a_value, b_value, field)
+        edwards = models.find_edwards_form(a_value, b_value, field)
+        self.assertTrue(models.is_complete_form(edwards, field))
+        for point in list_points(a_value, b_value, field):
+            montgomery = models.weierstrass_to_montgomery(point, form, field)
+            try:
+                edwards_point = models.montgomery_to_edwards(montgomery, field)
+            except ValueError:
+                continue
+            self.assertEqual(models.edwards_to_montgomery(edwards_point,
+                                                          field), montgomery)
+            for multiplier in range(30):
+                result = models.edwards_to_montgomery(
+                    models.edwards_multiply(edwards_point, multiplier,
+                                            edwards, field), field)
+                self.assertEqual(
+                    models.montgomery_to_weierstrass(result, form, field),
+                    double_and_add(point, multiplier, field, a_value))
+
+
+if __name__ == '__main__':
+    unittest.main()
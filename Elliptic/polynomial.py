@@ -0,0 +1,132 @@
+"""
+    Module contains arithmetic of polynomials over a prime field and
+    root finding\n
+    Polynomials are lists of coefficients from the free member up\n
+
+"""
+
+
+def poly_trim(poly):
+
+    """
+    Function removes leading zero coefficients of a polynomial\n
+    Polynomials are lists of coefficients from the free member up\n
+
+    :param list poly: polynomial\n
+
+    """
+
+    while poly and poly[-1] == 0:
+        poly.pop()
+    return poly
+
+
+def poly_divmod(numerator, denominator, field):
+
+    """
+    Function divides polynomials over a field\n
+    Returns (quotient, remainder)\n
+
+    :param list numerator: dividend polynomial\n
+    :param list denominator: non zero divisor polynomial\n
+    :param int field: an a curve field\n
+
+    """
+
+    remainder = list(numerator)
+    quotient = [0] * max(len(numerator) - len(denominator) + 1, 0)
+    inverse = pow(denominator[-1], -1, field)
+    while len(remainder) >= len(denominator):
+        coefficient = remainder[-1] * inverse % field
+        shift = len(remainder) - len(denominator)
+        quotient[shift] = coefficient
+        for index, value in enumerate(denominator):
+            remainder[shift + index] = \
+                (remainder[shift + index] - coefficient * value) % field
+        poly_trim(remainder)
+    return poly_trim(quotient), remainder
+
+
+def poly_gcd(f_poly, s_poly, field):
+
+    """
+    Function finds a monic gcd of two polynomials over a field\n
+
+    :param list f_poly: first polynomial\n
+    :param list s_poly: second polynomial\n
+    :param int field: an a curve field\n
+
+    """
+
+    f_poly, s_poly = poly_trim(list(f_poly)), poly_trim(list(s_poly))
+    while s_poly:
+        f_poly, s_poly = s_poly, poly_divmod(f_poly, s_poly, field)[1]
+    inverse = pow(f_poly[-1], -1, field)
+    return [value * inverse % field for value in f_poly]
+
+
+def poly_powmod(base, exponent, modulus, field):
+
+    """
+    Function raises a polynomial to a power modulo another polynomial\n
+
+    :param list base: polynomial\n
+    :param int exponent: non-negative power\n
+    :param list modulus: polynomial modulus\n
+    :param int field: an a curve field\n
+
+    """
+
+    def multiply(f_poly, s_poly):
+        product = [0] * (len(f_poly) + len(s_poly) - 1)
+        for f_index, f_value in enumerate(f_poly):
+            for s_index, s_value in enumerate(s_poly):
+                product[f_index + s_index] += f_value * s_value
+        return poly_divmod([value % field for value in product],
+                           modulus, field)[1]
+
+    result, base = [1], poly_divmod(base, modulus, field)[1]
+    while exponent:
+        if exponent & 1:
+            result = multiply(result, base) if base else []
+        base = multiply(base, base) if base else []
+        exponent >>= 1
+    return result
+
+
+def find_poly_roots(poly, field, rng):
+
+    """
+    Function finds all roots of a polynomial in a prime field with
+    Cantor-Zassenhaus splitting\n
+
+    :param list poly: polynomial\n
+    :param int field: an a curve field\n
+    :param Random rng: random generator\n
+
+    """
+
+    poly = poly_trim([value % field for value in poly])
+    # Product of linear factors: gcd(x^field - x, poly)
+    power = poly_powmod([0, 1], field, poly, field) + [0, 0]
+    power[1] = (power[1] - 1) % field
+    linear = poly_gcd(poly, power, field)
+
+    roots, stack = list(), [linear]
+    while stack:
+        factor = stack.pop()
+        if len(factor) <= 1:
+            continue
+        if len(factor) == 2:
+            roots.append(-factor[0] * pow(factor[1], -1, field) % field)
+            continue
+        while True:
+            shifted = poly_powmod([rng.randrange(field), 1], (field - 1) // 2,
+                                  factor, field) or [0]
+            shifted[0] = (shifted[0] - 1) % field
+            divisor = poly_gcd(factor, shifted, field)
+            if 1 < len(divisor) < len(factor):
+                stack.append(divisor)
+                stack.append(poly_divmod(factor, divisor, field)[0])
+                break
+    return roots
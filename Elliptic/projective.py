@@ -0,0 +1,490 @@
+"""
+    Module contains projective coordinates arithmetic for elliptic curves
+    of the following form: y^2 = x^3 + a*x + b\n
+    Addition uses complete formulas (Renes, Costello, Batina, 2016) which
+    handle doubling, inverse points and the point at infinity without
+    branches and are valid on curves that have no point of order 2\n
+    Constant-time multiplication uses fixed windows over regular signed
+    digits with masked table lookups for points of odd order and the
+    Montgomery ladder otherwise\n
+    Variable-time Jacobian formulas serve the fast path\n
+    Points are (X, Y, Z) tuples, point at infinity is (0, 1, 0)\n
+
+"""
+
+from math import isqrt
+
+
+INFINITY = (0, 1, 0)
+JACOBIAN_INFINITY = (1, 1, 0)
+# Bits of multiplier processed per addition by fixed-window method
+WINDOW_BITS = 4
+
+
+def to_projective(point):
+
+    """
+    Function converts an affine point into projective coordinates\n
+
+    :param tuple point: tuple that contains coordinates of the given point\n
+
+    """
+
+    return (point.x_crd, point.y_crd, 1)
+
+
+def to_affine(point, field):
+
+    """
+    Function converts a projective point into affine coordinates\n
+    Z of a constant-time result depends on the multiplier, so it is
+    inverted by Fermat's little theorem with the public exponent
+    field - 2 rather than by extended Euclid of data dependent length\n
+    Possible values: tuple([x_value, y_value]),
+                     None (In case point at infinity)\n
+
+    :param tuple point: (X, Y, Z) tuple\n
+    :param int field: an a curve field\n
+
+    """
+
+    x_crd, y_crd, z_crd = point
+    if z_crd % field == 0:
+        return None
+    inverse = pow(z_crd, field - 2, field)
+    return (x_crd * inverse % field, y_crd * inverse % field)
+
+
+def complete_add(f_point, s_point, field, a_value, b3_value):
+
+    """
+    Function finds a sum of two projective points with complete
+    addition formulas (algorithm 1 of Renes-Costello-Batina)\n
+    The same sequence of field operations is executed for any input\n
+
+    :param tuple f_point: first (X, Y, Z) tuple\n
+    :param tuple s_point: second (X, Y, Z) tuple\n
+    :param int field: an a curve field\n
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int b3_value: tripled b value in elliptic form E(a, b)\n
+
+    """
+
+    x1, y1, z1 = f_point
+    x2, y2, z2 = s_point
+
+    t0 = x1 * x2 % field
+    t1 = y1 * y2 % field
+    t2 = z1 * z2 % field
+    t3 = ((x1 + y1) * (x2 + y2) - t0 - t1) % field
+    t4 = ((x1 + z1) * (x2 + z2) - t0 - t2) % field
+    t5 = ((y1 + z1) * (y2 + z2) - t1 - t2) % field
+    z3 = (a_value * t4 + b3_value * t2) % field
+    x3 = t1 - z3
+    z3 = t1 + z3
+    t1 = (3 * t0 + a_value * t2) % field
+    t4 = (b3_value * t4 + a_value * (t0 - a_value * t2)) % field
+    y3 = (x3 * z3 + t1 * t4) % field
+    x3 = (t3 * x3 - t5 * t4) % field
+    z3 = (t5 * z3 + t3 * t1) % field
+
+    return (x3, y3, z3)
+
+
+def complete_double(point, field, a_value, b3_value):
+
+    """
+    Function doubles a projective point with complete doubling formulas
+    (algorithm 3 of Renes-Costello-Batina)\n
+
+    :param tuple point: (X, Y, Z) tuple\n
+    :param int field: an a curve field\n
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int b3_value: tripled b value in elliptic form E(a, b)\n
+
+    """
+
+    x_crd, y_crd, z_crd = point
+
+    t0 = x_crd * x_crd % field
+    t1 = y_crd * y_crd % field
+    t2 = z_crd * z_crd % field
+    z3 = 2 * x_crd * z_crd % field
+    y3 = (a_value * z3 + b3_value * t2) % field
+    x3 = t1 - y3
+    y3 = t1 + y3
+    t2 = a_value * t2 % field
+    t3 = (a_value * (t0 - t2) + b3_value * z3) % field
+    t0 = 3 * t0 + t2
+    t2 = 2 * y_crd * z_crd % field
+    y3 = (x3 * y3 + t0 * t3) % field
+    x3 = (2 * x_crd * y_crd * x3 - t2 * t3) % field
+    z3 = 4 * t2 * t1 % field
+
+    return (x3, y3, z3)
+
+
+def ladder_length(field, order=None):
+
+    """
+    Function finds a number of Montgomery ladder iterations: bit length
+    of the group order or of the Hasse bound if order is unknown\n
+
+    :param int field: an a curve field\n
+    :param int order: curve group order (optional)\n
+
+    """
+
+    if order is None:
+        order = field + 1 + 2 * isqrt(field)
+    return order.bit_length()
+
+
+def fixed_length_multiplier(multiplier, order):
+
+    """
+    Function adds order or doubled order to a multiplier in range
+    [0, order) so the result always has order.bit_length() + 1 bits and
+    a set leading bit. The choice is made with a mask, not a branch\n
+
+    :param int multiplier: int coefficient in range [0, order)\n
+    :param int order: curve group order\n
+
+    """
+
+    bits = order.bit_length()
+    padded = multiplier + order
+    mask = -(1 - (padded >> bits))
+    return padded + (order & mask)
+
+
+def ladder_multiply(point, multiplier, bits, field, a_value, b_value):
+
+    """
+    Function finds a composition of a projective point on given multiplier
+    with Montgomery ladder\n
+    The leading bit (bits - 1) of the multiplier must be set, so the
+    ladder starts from (P, 2P) and exactly bits - 1 iterations of one
+    addition and one doubling are done whatever the multiplier is.
+    Conditional swaps use masks instead of branches\n
+
+    :param tuple point: (X, Y, Z) tuple\n
+    :param int multiplier: int coefficient in range [2^(bits-1), 2^bits)\n
+    :param int bits: bit length of the multiplier\n
+    :param int field: an a curve field\n
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int b_value: an b value in elliptic form E(a, b)\n
+
+    """
+
+    b3_value = 3 * b_value % field
+    x0, y0, z0 = point
+    x1, y1, z1 = complete_double(point, field, a_value, b3_value)
+    swap = 0
+    for index in range(bits - 2, -1, -1):
+        bit = (multiplier >> index) & 1
+        mask = -(swap ^ bit)
+        swap = bit
+        delta = (x0 ^ x1) & mask
+        x0, x1 = x0 ^ delta, x1 ^ delta
+        delta = (y0 ^ y1) & mask
+        y0, y1 = y0 ^ delta, y1 ^ delta
+        delta = (z0 ^ z1) & mask
+        z0, z1 = z0 ^ delta, z1 ^ delta
+        x1, y1, z1 = complete_add((x0, y0, z0), (x1, y1, z1),
+                                  field, a_value, b3_value)
+        x0, y0, z0 = complete_double((x0, y0, z0), field, a_value, b3_value)
+    mask = -swap
+    delta = (x0 ^ x1) & mask
+    y_delta = (y0 ^ y1) & mask
+    z_delta = (z0 ^ z1) & mask
+    return (x0 ^ delta, y0 ^ y_delta, z0 ^ z_delta)
+
+
+def regular_digits(multiplier, windows):
+
+    """
+    Function recodes an odd multiplier into windows signed odd digits
+    d in +-1, +-3 .. +-(2^WINDOW_BITS - 1), most significant first, such
+    that multiplier = sum(d_i * 2^(WINDOW_BITS * i)) (Joye-Tunstall
+    regular recoding). Digits are never zero, so partial sums never pass
+    through the point at infinity\n
+
+    :param int multiplier: odd positive int coefficient below
+    2^(WINDOW_BITS * (windows - 1))\n
+    :param int windows: number of digits\n
+
+    """
+
+    digits = [0] * windows
+    modulus = 2 << WINDOW_BITS
+    for index in range(windows - 1, 0, -1):
+        digit = multiplier % modulus - (1 << WINDOW_BITS)
+        digits[index] = digit
+        multiplier = (multiplier - digit) >> WINDOW_BITS
+    digits[0] = multiplier
+    return digits
+
+
+def odd_multiples(point, field, a_value, b3_value):
+
+    """
+    Function finds a table P, 3P, 5P .. (2^WINDOW_BITS - 1)P of
+    projective points with complete formulas\n
+
+    :param tuple point: (X, Y, Z) tuple\n
+    :param int field: an a curve field\n
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int b3_value: tripled b value in elliptic form E(a, b)\n
+
+    """
+
+    double = complete_double(point, field, a_value, b3_value)
+    table = [point]
+    for _ in range(1, 1 << WINDOW_BITS - 1):
+        table.append(complete_add(table[-1], double, field, a_value,
+                                  b3_value))
+    return table
+
+
+def select_entry(table, position):
+
+    """
+    Function selects table[position] reading every entry of the table and
+    combining them with masks, so memory access pattern and the number
+    of operations don't depend on the position\n
+
+    :param list table: list of at most 2^WINDOW_BITS reduced (X, Y, Z)\n
+    :param int position: index of the entry\n
+
+    """
+
+    x_crd = y_crd = z_crd = 0
+    for index, (x_entry, y_entry, z_entry) in enumerate(table):
+        # -1 if index == position, 0 otherwise
+        mask = ((index ^ position) - 1) >> WINDOW_BITS
+        x_crd |= x_entry & mask
+        y_crd |= y_entry & mask
+        z_crd |= z_entry & mask
+    return (x_crd, y_crd, z_crd)
+
+
+def table_lookup(table, digit, field):
+
+    """
+    Function selects digit * P from a table of odd multiples with
+    select_entry, negative digits negate the entry with a mask\n
+
+    :param list table: result of odd_multiples\n
+    :param int digit: signed odd digit from regular_digits\n
+    :param int field: an a curve field\n
+
+    """
+
+    # -1 for negative digit, 0 otherwise
+    sign = digit >> WINDOW_BITS + 1
+    x_crd, y_crd, z_crd = select_entry(table, ((digit ^ sign) - sign) >> 1)
+    y_crd ^= (y_crd ^ (field - y_crd)) & sign
+    return (x_crd, y_crd, z_crd)
+
+
+def window_multiply(point, multiplier, bits, field, a_value, b_value):
+
+    """
+    Function finds a composition of a projective point on given odd
+    multiplier with fixed-window method over regular signed digits: for
+    every 4-bit window 4 complete doublings and one complete addition of
+    a masked table entry. The number of windows depends on bits only\n
+    It does about 4 times fewer additions than the ladder, but complete
+    formulas are exceptional for summands differing by a point of order 2,
+    so the point must have odd order\n
+
+    :param tuple point: (X, Y, Z) tuple of odd order\n
+    :param int multiplier: odd int coefficient in range [1, 2^bits)\n
+    :param int bits: bit length bound of the multiplier\n
+    :param int field: an a curve field\n
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int b_value: an b value in elliptic form E(a, b)\n
+
+    """
+
+    b3_value = 3 * b_value % field
+    table = odd_multiples(point, field, a_value, b3_value)
+    digits = regular_digits(multiplier, -(-bits // WINDOW_BITS) + 1)
+    result = table_lookup(table, digits[0], field)
+    for digit in digits[1:]:
+        for _ in range(WINDOW_BITS):
+            result = complete_double(result, field, a_value, b3_value)
+        result = complete_add(result, table_lookup(table, digit, field),
+                              field, a_value, b3_value)
+    return result
+
+
+def window_subtract(point, multiplier, bits, field, a_value, b_value):
+
+    """
+    Function finds a composition of a projective point of odd order on
+    multiplier in range [0, 2^bits) when the order is unknown: the odd
+    multiplier + 1 or multiplier + 2 is processed by window_multiply and
+    P or 2P, chosen with a mask, is subtracted by one complete addition\n
+
+    :param tuple point: (X, Y, Z) tuple of odd order\n
+    :param int multiplier: int coefficient in range [0, 2^bits)\n
+    :param int bits: bit length bound of the multiplier\n
+    :param int field: an a curve field\n
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int b_value: an b value in elliptic form E(a, b)\n
+
+    """
+
+    b3_value = 3 * b_value % field
+    parity = multiplier & 1
+    result = window_multiply(point, multiplier + 1 + parity, bits + 1,
+                             field, a_value, b_value)
+    x_crd, y_crd, z_crd = select_entry(
+        [point, complete_double(point, field, a_value, b3_value)], parity)
+    return complete_add(result, (x_crd, field - y_crd, z_crd), field,
+                        a_value, b3_value)
+
+
+def ladder_subtract(point, multiplier, bits, field, a_value, b_value):
+
+    """
+    Function finds a composition of a projective point on
+    multiplier - 2^bits with Montgomery ladder followed by bits doublings
+    of the point and one complete addition, so the leading bit of the
+    multiplier needn't be known in advance\n
+
+    :param tuple point: (X, Y, Z) tuple\n
+    :param int multiplier: int coefficient in range [2^bits, 2^(bits+1))\n
+    :param int bits: position of the leading bit of the multiplier\n
+    :param int field: an a curve field\n
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int b_value: an b value in elliptic form E(a, b)\n
+
+    """
+
+    b3_value = 3 * b_value % field
+    result = ladder_multiply(point, multiplier, bits + 1,
+                             field, a_value, b_value)
+    shift = point
+    for _ in range(bits):
+        shift = complete_double(shift, field, a_value, b3_value)
+    shift = (shift[0], -shift[1] % field, shift[2])
+    r_point = complete_add(result, shift, field, a_value, b3_value)
+    if any(r_point):
+        return r_point
+
+    # Points differ by a point of order 2, only possible on even order
+    # curves, so the sum is found with the generic formulas
+    result, shift = to_affine(result, field), to_affine(shift, field)
+    if result is None or shift is None:
+        r_point = shift or result
+    else:
+        r_point = jacobian_to_affine(
+            jacobian_add_affine(result + (1,), shift[0], shift[1],
+                                field, a_value), field)
+    return INFINITY if r_point is None else r_point + (1,)
+
+
+def jacobian_double(point, field, a_value):
+
+    """
+    Function doubles a point in Jacobian coordinates (x = X/Z^2, y = Y/Z^3)\n
+    Point at infinity is any point with Z = 0\n
+
+    :param tuple point: (X, Y, Z) tuple\n
+    :param int field: an a curve field\n
+    :param int a_value: an a value in elliptic form E(a, b)\n
+
+    """
+
+    x_crd, y_crd, z_crd = point
+    if y_crd == 0 or z_crd == 0:
+        return JACOBIAN_INFINITY
+    yy_value = y_crd * y_crd % field
+    zz_value = z_crd * z_crd % field
+    s_value = 4 * x_crd * yy_value % field
+    m_value = (3 * x_crd * x_crd + a_value * zz_value * zz_value) % field
+    rx_value = (m_value * m_value - 2 * s_value) % field
+    ry_value = (m_value * (s_value - rx_value) -
+                8 * yy_value * yy_value) % field
+    return (rx_value, ry_value, 2 * y_crd * z_crd % field)
+
+
+def jacobian_add_affine(point, x_value, y_value, field, a_value):
+
+    """
+    Function adds an affine point (x_value, y_value) to a point in
+    Jacobian coordinates\n
+
+    :param tuple point: (X, Y, Z) tuple\n
+    :param int x_value: x coordinate of the affine point\n
+    :param int y_value: y coordinate of the affine point\n
+    :param int field: an a curve field\n
+    :param int a_value: an a value in elliptic form E(a, b)\n
+
+    """
+
+    x_crd, y_crd, z_crd = point
+    if z_crd == 0:
+        return (x_value, y_value, 1)
+    zz_value = z_crd * z_crd % field
+    h_value = (x_value * zz_value - x_crd) % field
+    r_value = (y_value * z_crd * zz_value - y_crd) % field
+    if h_value == 0:
+        if r_value == 0:
+            return jacobian_double(point, field, a_value)
+        return JACOBIAN_INFINITY
+    hh_value = h_value * h_value % field
+    hhh_value = h_value * hh_value % field
+    v_value = x_crd * hh_value % field
+    rx_value = (r_value * r_value - hhh_value - 2 * v_value) % field
+    ry_value = (r_value * (v_value - rx_value) - y_crd * hhh_value) % field
+    return (rx_value, ry_value, z_crd * h_value % field)
+
+
+def jacobian_to_affine(point, field):
+
+    """
+    Function converts a Jacobian point into affine coordinates\n
+    Possible values: tuple([x_value, y_value]),
+                     None (In case point at infinity)\n
+
+    :param tuple point: (X, Y, Z) tuple\n
+    :param int field: an a curve field\n
+
+    """
+
+    x_crd, y_crd, z_crd = point
+    if z_crd % field == 0:
+        return None
+    inverse = pow(z_crd, -1, field)
+    square = inverse * inverse % field
+    return (x_crd * square % field, y_crd * square * inverse % field)
+
+
+def double_and_add(point, multiplier, field, a_value):
+
+    """
+    Function finds a composition of an affine point on given multiplier
+    with variable-time left-to-right double-and-add in Jacobian
+    coordinates\n
+    Possible values: tuple([x_value, y_value]),
+                     None (In case point at infinity)\n
+
+    :param tuple point: tuple that contains coordinates of the given point\n
+    :param int multiplier: non-negative int coefficient\n
+    :param int field: an a curve field\n
+    :param int a_value: an a value in elliptic form E(a, b)\n
+
+    """
+
+    x_value, y_value = point
+    result = JACOBIAN_INFINITY
+    for index in range(multiplier.bit_length() - 1, -1, -1):
+        result = jacobian_double(result, field, a_value)
+        if (multiplier >> index) & 1:
+            result = jacobian_add_affine(result, x_value, y_value,
+                                         field, a_value)
+    return jacobian_to_affine(result, field)
@@ -0,0 +1,355 @@
+"""
+    Module contains a search pipeline for elliptic curves of prime or
+    near-prime order over a given prime field\n
+    Candidates (a, b) are streamed by index = a * field + b, or by
+    index = b if a is fixed, and examined:\n
+    -> singular curves are rejected with find_discriminant\n
+    -> curves with a point of order 2 or 3 are rejected with polynomial
+    root tests before any point counting\n
+    -> points are counted with baby-step giant-step over Hasse interval,
+    which takes about p^(1/4) steps and limits fields to COUNT_BITS_LIMIT
+    bits (256-bit fields would need Schoof algorithm)\n
+    -> curves of order cofactor * prime are kept\n
+    Index ranges are examined in chunks across processes and progress is
+    saved to a checkpoint file, so an interrupted search resumes\n
+
+"""
+
+import json
+import os
+from math import isqrt
+from multiprocessing import Pool
+from random import Random
+from sympy import (
+    factorint,
+    isprime
+)
+from .curves import Curve
+from .ecdlp import add_affine
+from .elliptic import (
+    create_point,
+    find_discriminant,
+    find_ordinate
+)
+from .polynomial import find_poly_roots
+from .projective import double_and_add
+from .simplicityTests import (
+    gcd,
+    modular_sqrt
+)
+
+
+# Fields up to this size are counted point by point
+NAIVE_COUNT_LIMIT = 2 ** 12
+# Fields above this bit length are rejected by point counting,
+# baby-step giant-step tables hold about 2^(bits / 4) points
+COUNT_BITS_LIMIT = 96
+# Random points tried before point counting gives up
+COUNT_ATTEMPTS = 16
+# Candidates examined by one task
+CHUNK_SIZE = 256
+
+
+def has_torsion_point(a_value, b_value, field, prime, rng=None):
+
+    """
+    Function determines whether a curve has a point of order 2 or 3,
+    that is whether prime divides the curve order\n
+    Roots of x^3 + a*x + b are abscissas of points of order 2, roots of
+    the division polynomial 3*x^4 + 6*a*x^2 + 12*b*x - a^2 are abscissas
+    of points of order 3 (if x^3 + a*x + b is a square there)\n
+    Possible values: True, False\n
+
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int b_value: an b value in elliptic form E(a, b)\n
+    :param int field: an a curve field, greater than 3\n
+    :param int prime: 2 or 3\n
+    :param Random rng: random generator (optional)\n
+
+    """
+
+    rng = rng or Random()
+    if prime == 2:
+        return bool(find_poly_roots([b_value, a_value, 0, 1], field, rng))
+    for root in find_poly_roots([-a_value * a_value, 12 * b_value,
+                                 6 * a_value, 0, 3], field, rng):
+        if modular_sqrt(find_ordinate(root, a_value, b_value, field),
+                        field) is not None:
+            return True
+    return False
+
+
+def find_random_point(a_value, b_value, field, rng):
+
+    """
+    Function finds a random affine point of a curve\n
+
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int b_value: an b value in elliptic form E(a, b)\n
+    :param int field: an a curve field\n
+    :param Random rng: random generator\n
+
+    """
+
+    while True:
+        x_value = rng.randrange(field)
+        y_value = modular_sqrt(find_ordinate(x_value, a_value, b_value, field),
+                               field)
+        if y_value is not None:
+            if rng.getrandbits(1):
+                y_value = -y_value % field
+            return (x_value, y_value)
+
+
+def find_exact_order(point, multiple, field, a_value):
+
+    """
+    Function finds an exact order of a point from its known multiple\n
+
+    :param tuple point: affine point\n
+    :param int multiple: number m such that m*point is point at infinity\n
+    :param int field: an a curve field\n
+    :param int a_value: an a value in elliptic form E(a, b)\n
+
+    """
+
+    order = multiple
+    for prime in factorint(multiple):
+        while (order % prime == 0 and
+               double_and_add(point, order // prime, field, a_value) is None):
+            order //= prime
+    return order
+
+
+def count_points(a_value, b_value, field, rng=None):
+
+    """
+    Function counts points of a curve including point at infinity\n
+    Small fields are counted directly with Euler criterion. Otherwise
+    orders of random points are found with baby-step giant-step in the
+    Hasse interval p + 1 - 2*sqrt(p) .. p + 1 + 2*sqrt(p) in
+    O(p^(1/4)) operations until only one multiple of their lcm is left\n
+    Possible values: int,
+                     None (In case the order can't be pinned down),
+                     ValueError (In case the field has more than
+                     COUNT_BITS_LIMIT bits)\n
+
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int b_value: an b value in elliptic form E(a, b)\n
+    :param int field: an a curve field\n
+    :param Random rng: random generator (optional)\n
+
+    """
+
+    if field <= NAIVE_COUNT_LIMIT:
+        count = 1
+        for x_value in range(field):
+            ordinate = find_ordinate(x_value, a_value, b_value, field)
+            if ordinate == 0:
+                count += 1
+            elif pow(ordinate, (field - 1) // 2, field) == 1:
+                count += 2
+        return count
+
+    if field.bit_length() > COUNT_BITS_LIMIT:
+        raise ValueError("Field is too large for point counting")
+    rng = rng or Random()
+    low = field + 1 - isqrt(4 * field)
+    high = field + 1 + isqrt(4 * field)
+    steps = isqrt(high - low) + 1
+    exponent = 1
+
+    for _ in range(COUNT_ATTEMPTS):
+        point = find_random_point(a_value, b_value, field, rng)
+
+        # Baby steps j*P, j = 0 .. steps - 1, stored as -j*P
+        table, baby = dict(), None
+        for index in range(steps):
+            negated = None if baby is None else (baby[0], -baby[1] % field)
+            table.setdefault(negated, index)
+            baby = add_affine(baby, point, field, a_value)
+
+        # Giant steps (low + i*steps)*P, match m*P = 0 for m in interval
+        giant = double_and_add(point, low, field, a_value)
+        stride = double_and_add(point, steps, field, a_value)
+        multiple = None
+        for index in range(steps + 1):
+            if giant in table:
+                multiple = low + index * steps + table[giant]
+                break
+            giant = add_affine(giant, stride, field, a_value)
+        if multiple is None:
+            return None
+
+        order = find_exact_order(point, multiple, field, a_value)
+        exponent = exponent * order // gcd(exponent, order)
+        first = -(-low // exponent) * exponent
+        if first + exponent > high:
+            return first if first <= high else None
+    return None
+
+
+def examine_curve(a_value, b_value, field, max_cofactor=1, rng=None):
+
+    """
+    Function runs the search pipeline on one curve\n
+    Possible values: tuple([x, y, order]) with a base point of prime
+                     order and cofactor not above max_cofactor,
+                     None (In case the curve is rejected)\n
+
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int b_value: an b value in elliptic form E(a, b)\n
+    :param int field: an a curve field, greater than 3\n
+    :param int max_cofactor: maximal allowed cofactor (optional)\n
+    :param Random rng: random generator (optional)\n
+
+    """
+
+    rng = rng or Random()
+    if find_discriminant(a_value, b_value, field) == 0:
+        return None
+    for prime in (2, 3):
+        if (prime > max_cofactor and
+                has_torsion_point(a_value, b_value, field, prime, rng)):
+            return None
+
+    count = count_points(a_value, b_value, field, rng)
+    if count is None:
+        return None
+    for cofactor in range(1, max_cofactor + 1):
+        if count % cofactor == 0 and isprime(count // cofactor):
+            order = count // cofactor
+            break
+    else:
+        return None
+
+    while True:
+        point = double_and_add(find_random_point(a_value, b_value, field, rng),
+                               cofactor, field, a_value)
+        if point is not None:
+            return point + (order,)
+
+
+def examine_chunk(arguments):
+
+    """
+    Function examines candidates with indexes start .. stop - 1\n
+    Returns a list of (a, b, x, y, order) tuples of kept curves\n
+
+    :param tuple arguments: (field, start, stop, max_cofactor, seed,
+    a_value)\n
+
+    """
+
+    field, start, stop, max_cofactor, seed, fixed_a = arguments
+    rng = Random(seed * 1000003 + start)
+    found = list()
+    for index in range(start, stop):
+        if fixed_a is None:
+            a_value, b_value = divmod(index, field)
+        else:
+            a_value, b_value = fixed_a % field, index
+        result = examine_curve(a_value, b_value, field, max_cofactor, rng)
+        if result is not None:
+            found.append((a_value, b_value) + result)
+    return found
+
+
+def load_checkpoint(path, parameters):
+
+    """
+    Function reads search progress from a checkpoint file\n
+    Returns (next index, list of found tuples)\n
+    Possible values: tuple,
+                     ValueError (In case the checkpoint was saved with
+                     other search parameters)\n
+
+    :param str path: checkpoint file path\n
+    :param dict parameters: field, a_value, max_cofactor and seed of the
+    search\n
+
+    """
+
+    if path is None or not os.path.exists(path):
+        return 0, list()
+    with open(path) as checkpoint:
+        state = json.load(checkpoint)
+    for name, value in parameters.items():
+        if state.get(name) != value:
+            raise ValueError("Checkpoint belongs to another search")
+    return state["next"], [tuple(curve) for curve in state["found"]]
+
+
+def save_checkpoint(path, parameters, index, found):
+
+    """
+    Function atomically writes search progress to a checkpoint file\n
+
+    :param str path: checkpoint file path\n
+    :param dict parameters: field, a_value, max_cofactor and seed of the
+    search\n
+    :param int index: next candidate index\n
+    :param list found: found (a, b, x, y, order) tuples\n
+
+    """
+
+    state = dict(parameters, next=index, found=found)
+    with open(path + ".tmp", "w") as checkpoint:
+        json.dump(state, checkpoint)
+    os.replace(path + ".tmp", path)
+
+
+def search_curves(field, limit=1, max_cofactor=1, start=0, stop=None,
+                  processes=1, checkpoint=None, seed=0, a_value=None):
+
+    """
+    Function searches curves of order cofactor * prime over a field\n
+    Candidate indexes start .. stop - 1 (index = a * field + b, or b if
+    a_value is fixed, e.g. -3 as in standard curves) are split into
+    CHUNK_SIZE chunks examined by processes. Chunks complete in order,
+    so the checkpoint always holds the first unexamined index and a
+    search with the same checkpoint and parameters resumes from it\n
+    Returns a list of Curve with base points of prime order\n
+
+    :param int field: an a curve field, prime greater than 3\n
+    :param int limit: number of curves to find (optional)\n
+    :param int max_cofactor: maximal allowed cofactor (optional)\n
+    :param int start: first candidate index (optional)\n
+    :param int stop: candidate index limit (optional)\n
+    :param int processes: number of processes (optional)\n
+    :param str checkpoint: checkpoint file path (optional)\n
+    :param int seed: random generator seed (optional)\n
+    :param int a_value: fixed a value in elliptic form E(a, b) (optional)\n
+
+    """
+
+    if stop is None:
+        stop = field * field if a_value is None else field
+    parameters = {"field": field, "max_cofactor": max_cofactor,
+                  "seed": seed,
+                  "a_value": None if a_value is None else a_value % field}
+    index, found = load_checkpoint(checkpoint, parameters)
+    index = max(index, start)
+    if len(found) >= limit:
+        stop = index
+
+    chunks = ((field, chunk, min(chunk + CHUNK_SIZE, stop), max_cofactor,
+               seed, a_value) for chunk in range(index, stop, CHUNK_SIZE))
+    pool = Pool(processes) if processes > 1 and index < stop else None
+    results = pool.imap(examine_chunk, chunks) if pool else \
+        map(examine_chunk, chunks)
+    try:
+        for chunk_found in results:
+            found.extend(chunk_found)
+            index = min(index + CHUNK_SIZE, stop)
+            if checkpoint is not None:
+                save_checkpoint(checkpoint, parameters, index, found)
+            if len(found) >= limit:
+                break
+    finally:
+        if pool:
+            pool.terminate()
+            pool.join()
+
+    return [Curve(a, b, field, create_point(x_value, y_value), order)
+            for a, b, x_value, y_value, order in found[:limit]]
@@ -0,0 +1,76 @@
+"""
+    Module contains unit tests for search module
+
+"""
+
+import os
+import tempfile
+import unittest
+from random import Random
+from Elliptic import search
+from Elliptic.projective import double_and_add
+
+
+def naive_count(a_value, b_value, field):
+    count = 1
+    for x_value in range(field):
+        ordinate = (x_value ** 3 + a_value * x_value + b_value) % field
+        if ordinate == 0:
+            count += 1
+        elif pow(ordinate, (field - 1) // 2, field) == 1:
+            count += 2
+    return count
+
+
+class search_test(unittest.TestCase):
+
+    def test_count_points(self):
+        rng = Random(0)
+        for a_value, b_value in ((1, 1), (2, 3), (5, 7), (0, 3), (7, 0)):
+            count = naive_count(a_value, b_value, 5003)
+            self.assertEqual(
+                search.count_points(a_value, b_value, 5003, rng), count)
+            for prime in (2, 3):
+                self.assertEqual(
+                    search.has_torsion_point(a_value, b_value, 5003, prime,
+                                             rng),
+                    count % prime == 0)
+        self.assertRaises(ValueError, search.count_points, -3, 7,
+                          2 ** 127 - 1, rng)
+
+    def test_search_resume(self):
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint = os.path.join(directory, "search.json")
+            first = search.search_curves(5003, limit=2, a_value=-3,
+                                         checkpoint=checkpoint)
+            resumed = search.search_curves(5003, limit=4, a_value=-3,
+                                           checkpoint=checkpoint)
+            with open(checkpoint) as state:
+                saved = state.read()
+            self.assertEqual(search.search_curves(5003, limit=3, a_value=-3,
+                                                  checkpoint=checkpoint),
+                             resumed[:3])
+            with open(checkpoint) as state:
+                self.assertEqual(state.read(), saved)
+            for parameters in ({"limit": 5}, {"limit": 5, "a_value": 1},
+                               {"limit": 5, "a_value": -3, "seed": 1},
+                               {"limit": 5, "a_value": -3,
+                                "max_cofactor": 4}):
+                self.assertRaises(ValueError, search.search_curves, 5003,
+                                  checkpoint=checkpoint, **parameters)
+            self.assertRaises(ValueError, search.search_curves, 5009,
+                              a_value=-3, checkpoint=checkpoint)
+        self.assertEqual(resumed[:2], first)
+        self.assertEqual(resumed,
+                         search.search_curves(5003, limit=4, a_value=-3,
+                                              processes=2))
+        for curve in resumed:
+            self.assertEqual(curve.a_value, 5000)
+            self.assertIsNone(double_and_add(curve.point, curve.order,
+                                             curve.field, curve.a_value))
+            self.assertEqual(naive_count(curve.a_value, curve.b_value, 5003),
+                             curve.order)
+
+
+if __name__ == '__main__':
+    unittest.main()
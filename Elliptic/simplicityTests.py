@@ -5,6 +5,7 @@
 """
 
 from collections import namedtuple
+from functools import lru_cache
 from random import randint, seed
 from numpy import array
 
@@ -271,42 +272,90 @@ def root_computation(value, field):
         1 .. field - 1\n
 
     :param int value: value from which a root is required\n
-    :param int field: an a curve field
+    :param int field: an a curve field or its PrimeField context
 
     """
 
-    r_value = int()
-    min_denon = int()
     Point = namedtuple("Point", "x_crd y_crd")
 
     if euler_criterion(value, field) is not True:
         return ValueError("Given value is not mutually simple with field")
 
-    s_value, q_value = find_representation(field)
+    r_value = modular_sqrt(value, field)
+    return Point(r_value, -r_value % field)
 
-    if (field % 4) == 3:
-        r_value = int(pow(value, (field + 1) // 4, field))
-        return Point(r_value, -r_value % field)
 
-    z_value = find_quadratic_noncall(field)
-    c_value = int(pow(z_value, q_value, field))
-    r_value = int(pow(value, (q_value + 1) // 2, field))
-    t_value = int(pow(value, q_value, field))
-    m_value = s_value
+@lru_cache(maxsize=None)
+def find_sqrt_parameters(field):
 
-    while t_value != 1:
-        if m_value < 3:
-            min_denon = 1
-        else:
-            min_denon = find_minimal_deduction(t_value, m_value, field)
-        b_value = int(pow(c_value, int(pow(2, m_value - min_denon - 1, field)),
-                          field))
-        r_value = (r_value * b_value) % field
-        t_value = (t_value * int(pow(b_value, 2, field))) % field
-        c_value = int(pow(b_value, 2, field))
-        m_value = min_denon
+    """
+    Function finds Tonelli-Shenks constants of a given field once and
+    caches them, so repeated roots on one field cost a few pow calls.\n
+    Returns (s_value, q_value, c_value) where field - 1 = 2^s_value * q_value
+    and c_value is a quadratic non deduction raised to q_value
+    (None for fields with field % 4 == 3)\n
 
-    return Point(r_value, -r_value % field)
+    :param int field: an a curve field
+
+    """
+
+    # Integer division only, float representation breaks on big fields
+    s_value, q_value = 0, field - 1
+    while q_value % 2 == 0:
+        q_value //= 2
+        s_value += 1
+
+    if field % 4 == 3:
+        return s_value, q_value, None
+
+    z_value = 2
+    while pow(z_value, (field - 1) // 2, field) != field - 1:
+        z_value += 1
+
+    return s_value, q_value, pow(z_value, q_value, field)
+
+
+def modular_sqrt(value, field):
+
+    """
+    Function finds a root of a given value by given prime field
+    with cached Tonelli-Shenks constants.\n
+    Possible values: 0 .. field - 1, None (value is not deduction)\n
+
+    :param int value: value from which a root is required\n
+    :param int field: an a curve field
+
+    """
+
+    value %= field
+    if value == 0 or field == 2:
+        return value
+
+    s_value, q_value, c_value = find_sqrt_parameters(field)
+    if c_value is None:
+        # One exponentiation, non deduction is found by squaring back
+        r_value = pow(value, (field + 1) // 4, field)
+        return r_value if r_value * r_value % field == value else None
+
+    if pow(value, (field - 1) // 2, field) != 1:
+        return None
+
+    r_value = pow(value, (q_value + 1) // 2, field)
+    t_value = pow(value, q_value, field)
+    m_value = s_value
+    while t_value != 1:
+        # Find minimal i such that t^(2^i) == 1
+        i_value, square = 0, t_value
+        while square != 1:
+            square = square * square % field
+            i_value += 1
+        b_value = pow(c_value, 1 << (m_value - i_value - 1), field)
+        r_value = r_value * b_value % field
+        c_value = b_value * b_value % field
+        t_value = t_value * c_value % field
+        m_value = i_value
+
+    return r_value
 
 
 if __name__ == "__main__":
@@ -0,0 +1,105 @@
+"""
+    Module contains a statistical timing benchmark for scalar
+    multiplication\n
+    Two classes of multipliers (short and random full-length) are timed in
+    random interleaved order and compared with Welch's t-test. |t| above
+    TIMING_THRESHOLD means running time depends on the multiplier\n
+
+"""
+
+from math import sqrt
+from random import (
+    getrandbits,
+    randint,
+    shuffle
+)
+from time import perf_counter_ns
+from .curves import SECP256K1
+from .elliptic import multiply_point
+
+
+# Threshold used by dudect-like leakage detection
+TIMING_THRESHOLD = 4.5
+
+
+def welch_t_test(f_sample, s_sample):
+
+    """
+    Function finds Welch's t statistic of two samples\n
+
+    :param list f_sample: first sample of measurements\n
+    :param list s_sample: second sample of measurements\n
+
+    """
+
+    f_mean = sum(f_sample) / len(f_sample)
+    s_mean = sum(s_sample) / len(s_sample)
+    f_var = sum((x - f_mean) ** 2 for x in f_sample) / (len(f_sample) - 1)
+    s_var = sum((x - s_mean) ** 2 for x in s_sample) / (len(s_sample) - 1)
+    deviation = sqrt(f_var / len(f_sample) + s_var / len(s_sample))
+    if deviation == 0:
+        return 0.0
+    return (f_mean - s_mean) / deviation
+
+
+def measure_classes(curve, constant_time, samples=200, order=None):
+
+    """
+    Function times multiply_point on short multipliers (class 0) and
+    random full-length multipliers (class 1)\n
+    Returns a tuple of two lists of nanoseconds\n
+
+    :param Curve curve: curve parameters\n
+    :param bool constant_time: scalar multiplication mode\n
+    :param int samples: measurements per class (optional)\n
+    :param int order: order passed to multiply_point (optional)\n
+
+    """
+
+    bits = curve.order.bit_length()
+    jobs = ([(0, randint(1, 15)) for _ in range(samples)] +
+            [(1, getrandbits(bits) % (curve.order - 1) + 1)
+             for _ in range(samples)])
+    shuffle(jobs)
+
+    timings = (list(), list())
+    for label, multiplier in jobs:
+        start = perf_counter_ns()
+        multiply_point(curve.point, multiplier, curve.field, curve.a_value,
+                       curve.b_value, constant_time, order)
+        timings[label].append(perf_counter_ns() - start)
+    return timings
+
+
+def timing_report(curve=SECP256K1, samples=200, order=None):
+
+    """
+    Function benchmarks both scalar multiplication modes\n
+    Without order multiply_point runs as in diffy_hellman by default,
+    curve.order may be passed to time the paths that use it\n
+    Returns a dict: t statistic and mean time (ns) per mode and
+    constant-time to variable-time throughput ratio\n
+
+    :param Curve curve: curve parameters (optional)\n
+    :param int samples: measurements per class (optional)\n
+    :param int order: order passed to multiply_point (optional)\n
+
+    """
+
+    report = dict()
+    for mode, constant_time in (("variable", False), ("constant", True)):
+        short, full = measure_classes(curve, constant_time, samples, order)
+        report[mode + "_t"] = welch_t_test(short, full)
+        report[mode + "_mean"] = sum(full) / len(full)
+    report["ratio"] = report["constant_mean"] / report["variable_mean"]
+    return report
+
+
+if __name__ == "__main__":
+    for ORDER in (None, SECP256K1.order):
+        REPORT = timing_report(order=ORDER)
+        print("order:", "given" if ORDER else "not given")
+        print("variable-time t:", round(REPORT["variable_t"], 2))
+        print("constant-time t:", round(REPORT["constant_t"], 2),
+              "(leak threshold", TIMING_THRESHOLD, ")")
+        print("constant-time / variable-time:", round(REPORT["ratio"], 2))
@@ -5,7 +5,13 @@
 
 from sys import exit
 from matplotlib import pyplot as plt
-from numpy import ogrid
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from numpy import (
+    add,
+    array,
+    zeros
+)
 from sympy import mod_inverse
 from Elliptic.elliptic import (
     is_curve_exist,
@@ -17,7 +23,18 @@ from Elliptic.elliptic import (
     is_point_exist,
     diffy_hellman
 )
-from Elliptic.simplicityTests import root_computation
+from Elliptic.simplicityTests import (
+    modular_sqrt,
+    root_computation
+)
+
+
+# Abscissas taken for a plot at most
+PLOT_MAX_POINTS = 50000
+# Points drawn as a scatter at most, more are binned
+PLOT_SCATTER_LIMIT = 20000
+# Size of a density image
+PLOT_BINS = 512
 
 
 def system_cls(idention=100):
@@ -34,28 +51,110 @@ def system_cls(idention=100):
         print()
 
 
-def show_curve(a_value, b_value, field, point_dict):
+def sample_curve_points(a_value, b_value, field, point_dict=None,
+                        max_points=PLOT_MAX_POINTS):
 
     """
-    Function draw a graph of elliptic curve with given parameteres\n
+    Function yields curve points for plotting, at most about max_points
+    abscissas are taken: all of them for small curves, otherwise every
+    ceil(field / max_points) abscissa. Ordinates are taken from point_dict or
+    computed with modular square root when point_dict is not given\n
 
     :param int a_value: an a value in elliptic form E(a, b)\n
     :param int b_value: an b value in elliptic form E(a, b)\n
     :param int field: an a curve field\n
     :param defaultdict point_dict: an a dict that contains point's coordinates\n
+    :param int max_points: abscissas limit\n
 
     """
 
-    # Initialize 2D-axis for plt.show() 
-    y_axis, x_axis = ogrid[-field:field:4, -field:field:4]
-    # Set function equal
-    elliptic_func = y_axis ** 2 - x_axis ** 3 - x_axis * a_value - b_value
-    show_lvl = [1]
+    if point_dict is not None and len(point_dict) <= max_points:
+        for x_value, ordinates in point_dict.items():
+            for y_value in ordinates:
+                yield x_value, y_value
+        return
+
+    stride = -(-field // max_points)
+    for x_value in range(0, field, stride):
+        if point_dict is not None:
+            ordinates = point_dict.get(x_value, ())
+        else:
+            root = modular_sqrt(find_ordinate(x_value, a_value, b_value, field),
+                                field)
+            ordinates = () if root is None else {root, -root % field}
+        for y_value in ordinates:
+            yield x_value, y_value
+
+
+def draw_points(axes, points, field, scatter_limit=PLOT_SCATTER_LIMIT,
+                bins=PLOT_BINS):
+
+    """
+    Function draws points on given axes: as a scatter when there are at
+    most scatter_limit of them, otherwise as a bins x bins density image,
+    so memory doesn't depend on the field size\n
+
+    :param Axes axes: matplotlib axes\n
+    :param list points: list of (x, y) tuples\n
+    :param int field: an a curve field\n
+    :param int scatter_limit: scatter points limit\n
+    :param int bins: density image size\n
+
+    """
+
+    if len(points) <= scatter_limit:
+        axes.scatter([float(point[0]) for point in points],
+                     [float(point[1]) for point in points], s=4)
+        return
+
+    # Bin indexes are found in exact integers, coordinates may be huge
+    density = zeros((bins, bins))
+    rows = array([point[1] * bins // field for point in points])
+    columns = array([point[0] * bins // field for point in points])
+    add.at(density, (rows, columns), 1)
+    axes.imshow(density, origin="lower",
+                extent=(0, float(field), 0, float(field)),
+                aspect="auto", cmap="viridis", interpolation="nearest")
+
+
+def show_curve(a_value, b_value, field, point_dict, path=None):
+
+    """
+    Function draws points of elliptic curve with given parameteres\n
+    Large point sets are decimated and binned. With path the graph is
+    rendered off-screen into the file (format by extension), without a
+    display, otherwise it is shown in a window\n
+
+    :param int a_value: an a value in elliptic form E(a, b)\n
+    :param int b_value: an b value in elliptic form E(a, b)\n
+    :param int field: an a curve field\n
+    :param defaultdict point_dict: an a dict that contains point's coordinates\n
+    :param str path: output file path (optional)\n
+
+    """
+
+    points = list(sample_curve_points(a_value, b_value, field, point_dict))
+    title = ("Elliptic curve E" + str(field) + "(" + str(a_value) + " " +
+             str(b_value) + ")")
+
+    if path is not None:
+        # Off-screen Agg canvas doesn't touch pyplot state or a display
+        figure = Figure()
+        FigureCanvasAgg(figure)
+        axes = figure.add_subplot()
+    else:
+        figure, axes = plt.subplots()
+
+    draw_points(axes, points, field)
+    axes.set_title(title)
+    # Float limits, matplotlib can't handle big integers
+    axes.set_xlim(0, float(field))
+    axes.set_ylim(0, float(field))
+    axes.grid()
 
-    # plt.plot(x_coord, y_coord, "o") for plot points
-    plt.contour(x_axis.ravel(), y_axis.ravel(), elliptic_func, show_lvl)
-    plt.title("Elliptic curve E" + str(field) + "(" + str(a_value) + " " + str(b_value) + ")")
-    plt.grid()
+    if path is not None:
+        figure.savefig(path)
+        return path
     plt.show()
 
 
@@ -77,7 +176,8 @@ def main():
         print("Please, enter correct values...\nExit of a programm")
         exit(33)
     if is_curve_exist(a, b, field) is True:
-        points_dict = find_points(a, b, field)
+        # Points are listed on request only, plots take them on the fly
+        points_dict = None
         print("Curve is actually exist")
         print()
         while True:
@@ -94,6 +194,8 @@ def main():
                 continue
             print()
             if option == 1:
+                if points_dict is None:
+                    points_dict = find_points(a, b, field)
                 print("Requested dict of points:")
                 print("x | y")
                 for key in points_dict:
@@ -139,7 +241,9 @@ def main():
                 _ = input("Tap if you want to continue program execution")
                 system_cls(150)
             elif option == 4:
-                show_curve(a, b, field, points_dict)
+                path = input("Enter file path to save graph "
+                             "(empty to show it): ").strip()
+                show_curve(a, b, field, None, path or None)
                 _ = input("Tap if you want to continue program execution")
                 system_cls(150)
             elif option == 5:
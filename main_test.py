@@ -0,0 +1,70 @@
+"""
+    Module contains unit tests for main module
+
+"""
+
+import os
+import tempfile
+import unittest
+from random import Random
+from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
+import main
+from Elliptic.elliptic import find_points
+
+
+class main_test(unittest.TestCase):
+
+    def test_sample_bounds(self):
+        # Stride 10 would take 1001 abscissas of 10007, stride 11 takes 910
+        for field, stride in ((10007, 11), (1000003, 1001)):
+            abscissas = {point[0] for point in
+                         main.sample_curve_points(2, 3, field, None, 1000)}
+            self.assertTrue(abscissas)
+            self.assertEqual({x_value % stride for x_value in abscissas},
+                             {0})
+        self.assertEqual(len({point[0] for point in
+                              main.sample_curve_points(2, 3, 10007)}),
+                         len(find_points(2, 3, 10007)))
+
+    def test_sample_dict(self):
+        point_dict = find_points(2, 3, 10007)
+        for max_points in (main.PLOT_MAX_POINTS, 1000):
+            self.assertEqual(
+                set(main.sample_curve_points(2, 3, 10007, None, max_points)),
+                set(main.sample_curve_points(2, 3, 10007, point_dict,
+                                             max_points)))
+
+    def test_draw_points(self):
+        rng = Random(0)
+        field = 1000003
+        points = [(rng.randrange(field), rng.randrange(field))
+                  for _ in range(main.PLOT_SCATTER_LIMIT + 1)]
+        scatter = Figure().add_subplot()
+        main.draw_points(scatter, points[:-1], field)
+        self.assertEqual((len(scatter.collections), len(scatter.images)),
+                         (1, 0))
+        binned = Figure().add_subplot()
+        main.draw_points(binned, points, field)
+        self.assertEqual((len(binned.collections), len(binned.images)),
+                         (0, 1))
+        self.assertEqual(binned.images[0].get_array().sum(), len(points))
+
+    def test_show_headless(self):
+        environment = {name: os.environ.pop(name, None)
+                       for name in ("MPLBACKEND", "DISPLAY")}
+        try:
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, "curve.png")
+                self.assertEqual(main.show_curve(2, 3, 10007, None, path),
+                                 path)
+                self.assertGreater(os.path.getsize(path), 0)
+            self.assertEqual(plt.get_fignums(), [])
+        finally:
+            for name, value in environment.items():
+                if value is not None:
+                    os.environ[name] = value
+
+
+if __name__ == '__main__':
+    unittest.main()